@@ -6,7 +6,9 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
-sys.path.append(str(Path(__file__).parent.parent.parent))
+project_root = str(Path(__file__).resolve().parents[2])
+if project_root not in sys.path:
+    sys.path.append(project_root)
 
 from app.config import (
     POPULAR_STOCKS, RSI_OVERSOLD, RSI_OVERBOUGHT,
@@ -5,7 +5,9 @@ from datetime import datetime, timedelta
 import sys
 import os
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.append(app_dir)
 
 try:
     from src.data.data_loader import DataLoader
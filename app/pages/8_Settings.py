@@ -4,7 +4,9 @@ import streamlit as st
 import sys
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.parent.parent))
+project_root = str(Path(__file__).resolve().parents[2])
+if project_root not in sys.path:
+    sys.path.append(project_root)
 
 from app.config import (
     ENABLE_SENTIMENT_ANALYSIS, ENABLE_TELEGRAM_ALERTS, 
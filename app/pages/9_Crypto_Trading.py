@@ -6,7 +6,9 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
-sys.path.append(str(Path(__file__).parent.parent.parent))
+project_root = str(Path(__file__).resolve().parents[2])
+if project_root not in sys.path:
+    sys.path.append(project_root)
 
 from app.config import ENABLE_CRYPTO_TRADING, POPULAR_STOCKS
 from src.data.crypto_loader import CryptoLoader
@@ -228,7 +230,8 @@ with tab2:
                         predictions={model_type: predictions},
                         forecast_days=forecast_days,
                         symbol=selected_crypto,
-                        confidence_level=95
+                        confidence_level=95,
+                        freq='D'
                     )
                     st.plotly_chart(fig_forecast, use_container_width=True)
                 else:
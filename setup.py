@@ -57,6 +57,7 @@ setup(
         'dev': [
             'pytest>=8.1.0',
             'pytest-cov>=4.1.0',
+            'pytest-xdist>=3.5.0',
             'black>=24.2.0',
             'flake8>=7.0.0',
             'mypy>=1.9.0',
@@ -82,6 +83,7 @@ setup(
         'all': [
             'pytest>=8.1.0',
             'pytest-cov>=4.1.0',
+            'pytest-xdist>=3.5.0',
             'black>=24.2.0',
             'flake8>=7.0.0',
             'mypy>=1.9.0',
@@ -1,11 +1,6 @@
 # src/alerts/alert_manager.py
 
 from datetime import datetime
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.alerts.telegram_bot import TelegramBot
 from src.alerts.email_sender import EmailSender
@@ -1,13 +1,8 @@
 # src/alerts/alert_scheduler.py
 
 from datetime import datetime, time
-from pathlib import Path
-import sys
 import threading
 
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 from src.alerts.alert_manager import AlertManager
 from src.utils.logger import Logger
 
@@ -1,11 +1,6 @@
 # src/alerts/discord_webhook.py
 
 import requests
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.utils.logger import Logger
 
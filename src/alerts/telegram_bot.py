@@ -1,11 +1,6 @@
 # src/alerts/telegram_bot.py
 
 import requests
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
 from src.utils.logger import Logger
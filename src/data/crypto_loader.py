@@ -3,11 +3,6 @@
 import yfinance as yf
 import pandas as pd
 import requests
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.config import ENABLE_CRYPTO_TRADING
 from src.data.data_cache import DataCache
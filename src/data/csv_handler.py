@@ -2,11 +2,6 @@
 
 import pandas as pd
 import io
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.data.data_validator import DataValidator
 from src.utils.logger import Logger
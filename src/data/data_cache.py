@@ -2,12 +2,7 @@
 
 import pandas as pd
 import pickle
-from pathlib import Path
 from datetime import datetime, timedelta
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.config import CACHE_DIR, CACHE_TTL_HOURS
 from src.utils.logger import Logger
@@ -3,12 +3,8 @@
 import yfinance as yf
 import pandas as pd
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.config import (
     ALPHAVANTAGE_KEY,
@@ -20,6 +16,8 @@ from src.data.data_cache import DataCache
 from src.data.data_validator import DataValidator
 from src.utils.logger import Logger
 
+MAX_FETCH_WORKERS = 8
+
 class DataLoader:
     def __init__(self):
         self.cache = DataCache()
@@ -141,12 +139,18 @@ class DataLoader:
             return {}
     
     def get_multiple_stocks(self, symbols, period=DEFAULT_PERIOD):
+        symbols = list(symbols)
         results = {}
         
-        for symbol in symbols:
-            df = self.load_stock_data(symbol, period=period)
-            if df is not None and not df.empty:
-                results[symbol] = df
+        if not symbols:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=min(len(symbols), MAX_FETCH_WORKERS)) as executor:
+            frames = executor.map(lambda symbol: self.load_stock_data(symbol, period=period), symbols)
+            
+            for symbol, df in zip(symbols, frames):
+                if df is not None and not df.empty:
+                    results[symbol] = df
         
         return results
     
@@ -2,11 +2,6 @@
 
 import yfinance as yf
 import pandas as pd
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.utils.logger import Logger
 
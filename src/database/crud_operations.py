@@ -1,11 +1,5 @@
 # src/database/crud_operations.py
 
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 from src.database.db_manager import DBManager
 from src.database.models import User, Portfolio, Alert, Prediction, Watchlist
 from src.utils.logger import Logger
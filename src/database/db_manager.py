@@ -1,11 +1,8 @@
 # src/database/db_manager.py
 
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.config import DATABASE_PATH
 from src.utils.logger import Logger
@@ -15,6 +12,7 @@ class DBManager:
         self.logger = Logger(__name__)
         self.db_path = db_path or DATABASE_PATH
         self.connection = None
+        self._in_transaction = False
         self._ensure_database_exists()
     
     def _ensure_database_exists(self):
@@ -54,16 +52,34 @@ class DBManager:
             else:
                 cursor.execute(query)
             
-            self.connection.commit()
+            if not self._in_transaction:
+                self.connection.commit()
             
             return cursor
         
         except Exception as e:
             self.logger.error(f"Error executing query: {str(e)}")
+            if self._in_transaction:
+                raise
             if self.connection:
                 self.connection.rollback()
             return None
     
+    @contextmanager
+    def transaction(self):
+        if not self.connection:
+            self.connect()
+        
+        self._in_transaction = True
+        try:
+            yield self.connection
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+    
     def fetch_all(self, query, params=None):
         try:
             cursor = self.execute_query(query, params)
@@ -76,6 +92,8 @@ class DBManager:
         
         except Exception as e:
             self.logger.error(f"Error fetching data: {str(e)}")
+            if self._in_transaction:
+                raise
             return []
     
     def fetch_one(self, query, params=None):
@@ -90,6 +108,8 @@ class DBManager:
         
         except Exception as e:
             self.logger.error(f"Error fetching data: {str(e)}")
+            if self._in_transaction:
+                raise
             return None
     
     def initialize_database(self):
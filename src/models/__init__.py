@@ -1,16 +1,31 @@
 # src/models/__init__.py
 
-from .base_model import BaseModel
-from .linear_regression import LinearRegressionModel
-from .lstm_model import LSTMModel
-from .random_forest import RandomForestModel
-from .xgboost_model import XGBoostModel
-from .ensemble import EnsembleModel
-from .model_trainer import ModelTrainer
-from .model_evaluator import ModelEvaluator
-from .model_registry import ModelRegistry
-from .model_loader import ModelLoader
-from .hyperparameter_tuner import HyperparameterTuner
+import importlib
+
+_LAZY = {
+    'BaseModel': 'base_model',
+    'LinearRegressionModel': 'linear_regression',
+    'LSTMModel': 'lstm_model',
+    'RandomForestModel': 'random_forest',
+    'XGBoostModel': 'xgboost_model',
+    'EnsembleModel': 'ensemble',
+    'ModelTrainer': 'model_trainer',
+    'ModelEvaluator': 'model_evaluator',
+    'ModelRegistry': 'model_registry',
+    'ModelLoader': 'model_loader',
+    'HyperparameterTuner': 'hyperparameter_tuner'
+}
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(f'.{_LAZY[name]}', __name__)
+        cls = getattr(module, name)
+        globals()[name] = cls
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
     'BaseModel',
@@ -3,11 +3,6 @@
 from abc import ABC, abstractmethod
 import pandas as pd
 import numpy as np
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.utils.logger import Logger
 
@@ -4,10 +4,6 @@ import numpy as np
 import pandas as pd
 import pickle
 from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.models.base_model import BaseModel
 from src.models.linear_regression import LinearRegressionModel
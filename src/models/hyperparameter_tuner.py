@@ -3,11 +3,6 @@
 import numpy as np
 import pandas as pd
 from sklearn.model_selection import GridSearchCV, TimeSeriesSplit
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.models.random_forest import RandomForestModel
 from src.models.xgboost_model import XGBoostModel
@@ -5,11 +5,6 @@ import pandas as pd
 import pickle
 from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import StandardScaler
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.models.base_model import BaseModel
 
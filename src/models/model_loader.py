@@ -1,11 +1,6 @@
 # src/models/model_loader.py
 
 import pandas as pd
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.config import get_model_path, POPULAR_STOCKS
 from src.models.model_registry import ModelRegistry
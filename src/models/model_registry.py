@@ -4,10 +4,6 @@ import json
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.config import MODELS_DIR, POPULAR_MODELS_DIR, CACHED_MODELS_DIR
 from src.utils.logger import Logger
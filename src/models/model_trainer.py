@@ -2,13 +2,8 @@
 
 import numpy as np
 import pandas as pd
-from pathlib import Path
-import sys
 from datetime import datetime
 
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 from src.models.linear_regression import LinearRegressionModel
 from src.models.random_forest import RandomForestModel
 from src.models.xgboost_model import XGBoostModel
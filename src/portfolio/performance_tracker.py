@@ -3,11 +3,6 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.data.data_loader import DataLoader
 from src.utils.logger import Logger
@@ -1,13 +1,8 @@
 # src/portfolio/portfolio_manager.py
 
 from datetime import datetime
-from pathlib import Path
-import sys
 import json
 
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 from src.data.data_loader import DataLoader
 from src.utils.logger import Logger
 
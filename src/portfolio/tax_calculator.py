@@ -1,11 +1,6 @@
 # src/portfolio/tax_calculator.py
 
 from datetime import datetime
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.data.data_loader import DataLoader
 from src.utils.logger import Logger
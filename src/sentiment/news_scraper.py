@@ -3,13 +3,8 @@
 import requests
 from datetime import datetime, timedelta
 import feedparser
-from pathlib import Path
-import sys
 import json
 
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 from app.config import NEWSAPI_KEY, FINNHUB_KEY, SENTIMENT_DIR, NEWS_SOURCES
 from src.utils.logger import Logger
 
@@ -2,13 +2,8 @@
 
 import requests
 from datetime import datetime, timedelta
-from pathlib import Path
-import sys
 import re
 
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 from src.utils.logger import Logger
 
 class SECFilings:
@@ -1,11 +1,6 @@
 # src/sentiment/sentiment_aggregator.py
 
 from datetime import datetime
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.sentiment.news_scraper import NewsScraper
 from src.sentiment.social_sentiment import SocialSentiment
@@ -1,11 +1,6 @@
 # src/sentiment/sentiment_analyzer.py
 
 import re
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.config import SENTIMENT_POSITIVE_THRESHOLD, SENTIMENT_NEGATIVE_THRESHOLD
 from src.utils.logger import Logger
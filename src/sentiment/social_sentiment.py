@@ -1,11 +1,6 @@
 # src/sentiment/social_sentiment.py
 
 from datetime import datetime, timedelta
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.config import STOCK_KEYWORDS
 from src.utils.logger import Logger
@@ -6,6 +6,7 @@ from .strategy_engine import StrategyEngine
 from .recommendation_ai import RecommendationAI
 from .position_sizer import PositionSizer
 from .stop_loss_calculator import StopLossCalculator
+from .hotpath import BarContext, extract_bar_context, evaluate_bar
 
 __all__ = [
     'SignalGenerator',
@@ -13,5 +14,8 @@ __all__ = [
     'StrategyEngine',
     'RecommendationAI',
     'PositionSizer',
-    'StopLossCalculator'
+    'StopLossCalculator',
+    'BarContext',
+    'extract_bar_context',
+    'evaluate_bar'
 ]
\ No newline at end of file
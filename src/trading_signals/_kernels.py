@@ -0,0 +1,199 @@
+# src/trading_signals/_kernels.py
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _crossings(fast, slow):
+    above = np.flatnonzero((fast[:-1] < slow[:-1]) & (fast[1:] > slow[1:])) + 1
+    below = np.flatnonzero((fast[:-1] > slow[:-1]) & (fast[1:] < slow[1:])) + 1
+    return above, below
+
+def _pair_trade_returns(buy_idx, sell_idx, close):
+    next_sell = np.searchsorted(sell_idx, buy_idx, side='right')
+    valid = next_sell < len(sell_idx)
+    entries = buy_idx[valid]
+    next_sell = next_sell[valid]
+    
+    opens_position = np.ones(len(next_sell), dtype=bool)
+    opens_position[1:] = next_sell[1:] != next_sell[:-1]
+    entries = entries[opens_position]
+    exits = sell_idx[next_sell[opens_position]]
+    
+    entry_prices = close[entries]
+    return (close[exits] - entry_prices) / entry_prices * 100.0
+
+def _rsi_backtest_numpy(rsi, close):
+    buy_idx = np.flatnonzero((rsi[:-1] <= 30) & (rsi[1:] > 30)) + 1
+    sell_idx = np.flatnonzero((rsi[:-1] >= 70) & (rsi[1:] < 70)) + 1
+    return len(buy_idx), len(sell_idx), _pair_trade_returns(buy_idx, sell_idx, close)
+
+def _cross_backtest_numpy(fast, slow, close):
+    buy_idx, sell_idx = _crossings(fast, slow)
+    return len(buy_idx), len(sell_idx), _pair_trade_returns(buy_idx, sell_idx, close)
+
+def _composite_votes(close, rsi, macd, macd_signal, sma20, sma50, bb_upper, bb_lower):
+    buy_votes = (
+        (rsi < 30).astype(np.uint8)
+        + (macd > macd_signal).astype(np.uint8)
+        + ((close > sma20) & (sma20 > sma50)).astype(np.uint8)
+        + (close < bb_lower).astype(np.uint8)
+    )
+    sell_votes = (
+        (rsi > 70).astype(np.uint8)
+        + (macd < macd_signal).astype(np.uint8)
+        + ((close < sma20) & (sma20 < sma50)).astype(np.uint8)
+        + (close > bb_upper).astype(np.uint8)
+    )
+    return buy_votes, sell_votes
+
+def _onsets(state):
+    return np.flatnonzero(state[1:] & ~state[:-1]) + 1
+
+def composite_backtest(close, rsi, macd, macd_signal, sma20, sma50, bb_upper, bb_lower):
+    buy_votes, sell_votes = _composite_votes(close, rsi, macd, macd_signal, sma20, sma50, bb_upper, bb_lower)
+    buy_idx = _onsets((buy_votes >= 2) & (buy_votes > sell_votes))
+    sell_idx = _onsets((sell_votes >= 2) & (sell_votes > buy_votes))
+    return len(buy_idx), len(sell_idx), _pair_trade_returns(buy_idx, sell_idx, close)
+
+def _rsi_backtest_loop(rsi, close):
+    profits = np.empty(rsi.shape[0])
+    n_buy = 0
+    n_sell = 0
+    n_trades = 0
+    in_position = False
+    entry_price = 0.0
+    
+    for i in range(1, rsi.shape[0]):
+        if rsi[i-1] <= 30 and rsi[i] > 30:
+            n_buy += 1
+            if not in_position:
+                in_position = True
+                entry_price = close[i]
+        elif rsi[i-1] >= 70 and rsi[i] < 70:
+            n_sell += 1
+            if in_position:
+                profits[n_trades] = (close[i] - entry_price) / entry_price * 100.0
+                n_trades += 1
+                in_position = False
+    
+    return n_buy, n_sell, profits[:n_trades]
+
+def _cross_backtest_loop(fast, slow, close):
+    profits = np.empty(fast.shape[0])
+    n_buy = 0
+    n_sell = 0
+    n_trades = 0
+    in_position = False
+    entry_price = 0.0
+    
+    for i in range(1, fast.shape[0]):
+        if fast[i-1] < slow[i-1] and fast[i] > slow[i]:
+            n_buy += 1
+            if not in_position:
+                in_position = True
+                entry_price = close[i]
+        elif fast[i-1] > slow[i-1] and fast[i] < slow[i]:
+            n_sell += 1
+            if in_position:
+                profits[n_trades] = (close[i] - entry_price) / entry_price * 100.0
+                n_trades += 1
+                in_position = False
+    
+    return n_buy, n_sell, profits[:n_trades]
+
+def _all_backtests_numpy(close, rsi, macd, macd_signal, sma20, sma50, bb_upper, bb_lower):
+    rsi_buy, rsi_sell, rsi_profits = _rsi_backtest_numpy(rsi, close)
+    macd_buy, macd_sell, macd_profits = _cross_backtest_numpy(macd, macd_signal, close)
+    ma_buy, ma_sell = (len(idx) for idx in _crossings(sma20, sma50))
+    
+    below_lower = close < bb_lower
+    bb_buy = int(below_lower.sum())
+    bb_sell = int((~below_lower & (close > bb_upper)).sum())
+    
+    return (rsi_buy, rsi_sell, rsi_profits, macd_buy, macd_sell, macd_profits,
+            ma_buy, ma_sell, bb_buy, bb_sell)
+
+def _all_backtests_loop(close, rsi, macd, macd_signal, sma20, sma50, bb_upper, bb_lower):
+    n = close.shape[0]
+    rsi_profits = np.empty(n)
+    macd_profits = np.empty(n)
+    rsi_buy = rsi_sell = rsi_trades = 0
+    macd_buy = macd_sell = macd_trades = 0
+    ma_buy = ma_sell = 0
+    bb_buy = bb_sell = 0
+    rsi_entry = 0.0
+    macd_entry = 0.0
+    rsi_in_position = False
+    macd_in_position = False
+    
+    if n > 0:
+        if close[0] < bb_lower[0]:
+            bb_buy += 1
+        elif close[0] > bb_upper[0]:
+            bb_sell += 1
+    
+    for i in range(1, n):
+        price = close[i]
+        
+        if rsi[i-1] <= 30 and rsi[i] > 30:
+            rsi_buy += 1
+            if not rsi_in_position:
+                rsi_in_position = True
+                rsi_entry = price
+        elif rsi[i-1] >= 70 and rsi[i] < 70:
+            rsi_sell += 1
+            if rsi_in_position:
+                rsi_profits[rsi_trades] = (price - rsi_entry) / rsi_entry * 100.0
+                rsi_trades += 1
+                rsi_in_position = False
+        
+        if macd[i-1] < macd_signal[i-1] and macd[i] > macd_signal[i]:
+            macd_buy += 1
+            if not macd_in_position:
+                macd_in_position = True
+                macd_entry = price
+        elif macd[i-1] > macd_signal[i-1] and macd[i] < macd_signal[i]:
+            macd_sell += 1
+            if macd_in_position:
+                macd_profits[macd_trades] = (price - macd_entry) / macd_entry * 100.0
+                macd_trades += 1
+                macd_in_position = False
+        
+        if sma20[i-1] < sma50[i-1] and sma20[i] > sma50[i]:
+            ma_buy += 1
+        elif sma20[i-1] > sma50[i-1] and sma20[i] < sma50[i]:
+            ma_sell += 1
+        
+        if price < bb_lower[i]:
+            bb_buy += 1
+        elif price > bb_upper[i]:
+            bb_sell += 1
+    
+    return (rsi_buy, rsi_sell, rsi_profits[:rsi_trades], macd_buy, macd_sell, macd_profits[:macd_trades],
+            ma_buy, ma_sell, bb_buy, bb_sell)
+
+if NUMBA_AVAILABLE:
+    _rsi_backtest = njit(cache=True)(_rsi_backtest_loop)
+    _cross_backtest = njit(cache=True)(_cross_backtest_loop)
+    _all_backtests = njit(cache=True)(_all_backtests_loop)
+else:
+    _rsi_backtest = _rsi_backtest_numpy
+    _cross_backtest = _cross_backtest_numpy
+    _all_backtests = _all_backtests_numpy
+
+def rsi_backtest(rsi, close):
+    return _rsi_backtest(rsi, close)
+
+def macd_backtest(macd, signal, close):
+    return _cross_backtest(macd, signal, close)
+
+def ma_backtest(sma20, sma50, close):
+    return _cross_backtest(sma20, sma50, close)
+
+def all_backtests(close, rsi, macd, macd_signal, sma20, sma50, bb_upper, bb_lower):
+    return _all_backtests(close, rsi, macd, macd_signal, sma20, sma50, bb_upper, bb_lower)
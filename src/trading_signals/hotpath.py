@@ -0,0 +1,65 @@
+# src/trading_signals/hotpath.py
+
+import numpy as np
+
+class BarContext:
+    __slots__ = (
+        'length', 'close', 'close_hist', 'high_hist', 'low_hist',
+        'rsi', 'macd', 'macd_prev', 'macd_signal', 'macd_signal_prev',
+        'sma20', 'sma20_prev', 'sma50', 'sma50_prev',
+        'bb_upper', 'bb_lower', 'bb_middle', 'atr', 'volume_ratio'
+    )
+    
+    def __len__(self):
+        return self.length
+
+def _last(df, column):
+    if column not in df.columns:
+        return None
+    return float(df[column].iloc[-1])
+
+def _last_two(df, column):
+    if column not in df.columns:
+        return None, None
+    values = df[column].to_numpy()
+    prev = float(values[-2]) if len(values) > 1 else np.nan
+    return float(values[-1]), prev
+
+def _tail(df, column, n):
+    if column not in df.columns:
+        return None
+    return df[column].to_numpy()[-n:].astype(float)
+
+def extract_bar_context(df):
+    bar = BarContext()
+    bar.length = len(df)
+    
+    bar.close_hist = _tail(df, 'Close', 21)
+    bar.high_hist = _tail(df, 'High', 22)
+    bar.low_hist = _tail(df, 'Low', 20)
+    bar.close = float(bar.close_hist[-1]) if bar.close_hist is not None else None
+    
+    bar.rsi = _last(df, 'RSI')
+    bar.macd, bar.macd_prev = _last_two(df, 'MACD')
+    bar.macd_signal, bar.macd_signal_prev = _last_two(df, 'MACD_Signal')
+    bar.sma20, bar.sma20_prev = _last_two(df, 'SMA_20')
+    bar.sma50, bar.sma50_prev = _last_two(df, 'SMA_50')
+    bar.bb_upper = _last(df, 'BB_Upper')
+    bar.bb_lower = _last(df, 'BB_Lower')
+    bar.bb_middle = _last(df, 'BB_Middle')
+    bar.atr = _last(df, 'ATR')
+    bar.volume_ratio = _last(df, 'Volume_Ratio')
+    
+    return bar
+
+def evaluate_bar(df, signal_generator, stop_loss_calculator, entry_price=None,
+                 strategy='AI Composite', sensitivity='Moderate', risk_tolerance='Medium'):
+    bar = df if isinstance(df, BarContext) else extract_bar_context(df)
+    
+    if entry_price is None:
+        entry_price = bar.close
+    
+    signal_result = signal_generator.generate_signal(bar, strategy, sensitivity)
+    stop_result = stop_loss_calculator.get_comprehensive_stop_analysis(entry_price, bar, risk_tolerance)
+    
+    return signal_result, stop_result
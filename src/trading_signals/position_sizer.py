@@ -1,11 +1,6 @@
 # src/trading_signals/position_sizer.py
 
 import numpy as np
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.config import MAX_POSITION_SIZE_PCT
 from src.utils.logger import Logger
@@ -2,14 +2,88 @@
 
 import numpy as np
 import pandas as pd
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.config import DEFAULT_STOP_LOSS_PCT, DEFAULT_TAKE_PROFIT_PCT
 from src.utils.logger import Logger
+from src.trading_signals.hotpath import BarContext
+
+_SL = DEFAULT_STOP_LOSS_PCT / 100.0
+_SL_2X = _SL * 2
+_SL_1_5X = _SL * 1.5
+_SL_0_5X = _SL * 0.5
+_SL_0_6X = _SL * 0.6
+_TP = DEFAULT_TAKE_PROFIT_PCT / 100.0
+
+_RISK_TOLERANCE_PCT = {
+    'Low': DEFAULT_STOP_LOSS_PCT * 0.6,
+    'Medium': DEFAULT_STOP_LOSS_PCT,
+    'High': DEFAULT_STOP_LOSS_PCT * 1.4
+}
+
+def _mean(xs):
+    return sum(xs) / len(xs)
+
+def _median3(a, b, c):
+    return a + b + c - min(a, b, c) - max(a, b, c)
+
+def _std(xs):
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for x in xs:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    return (m2 / n) ** 0.5
+
+def _recent_low(lows):
+    return float(lows[-20:].min())
+
+def _recent_high(highs):
+    return float(highs[-10:].max())
+
+def _recent_volatility(closes):
+    closes = closes[-21:].astype(float, copy=False)
+    returns = closes[1:] / closes[:-1] - 1.0
+    return float(returns.std(ddof=1))
+
+def _exit_ladder(num_exits):
+    if num_exits <= 0:
+        return np.empty(0, dtype=int), np.empty(0), np.empty(0)
+    
+    exit_numbers = np.arange(1, num_exits + 1)
+    position_pcts = np.full(num_exits, 100 / num_exits)
+    position_pcts[-1] = 100 - position_pcts[:-1].sum()
+    rr_ratios = exit_numbers * 1.5
+    return exit_numbers, position_pcts, rr_ratios
+
+class _StopContext:
+    __slots__ = ('atr_last', 'low_min_20', 'high_max_10', 'volatility_20')
+    
+    def __init__(self, atr_last, low_min_20, high_max_10, volatility_20):
+        self.atr_last = atr_last
+        self.low_min_20 = low_min_20
+        self.high_max_10 = high_max_10
+        self.volatility_20 = volatility_20
+
+def _build_stop_context(df):
+    n = len(df)
+    
+    if isinstance(df, BarContext):
+        return _StopContext(
+            df.atr,
+            _recent_low(df.low_hist) if n >= 20 else None,
+            _recent_high(df.high_hist) if n >= 10 else None,
+            _recent_volatility(df.close_hist) if n >= 20 else None
+        )
+    
+    return _StopContext(
+        float(df['ATR'].iloc[-1]) if 'ATR' in df.columns else None,
+        _recent_low(df['Low'].to_numpy()) if n >= 20 else None,
+        _recent_high(df['High'].to_numpy()) if n >= 10 else None,
+        _recent_volatility(df['Close'].to_numpy()) if n >= 20 else None
+    )
 
 class StopLossCalculator:
     def __init__(self):
@@ -20,87 +94,106 @@ class StopLossCalculator:
             self.logger.error("Entry price must be positive")
             return 0
         
+        ctx = _build_stop_context(df) if isinstance(df, BarContext) else None
+        
         if method == 'percentage':
             return self._percentage_stop_loss(entry_price, custom_pct)
         elif method == 'atr':
-            return self._atr_stop_loss(entry_price, df, atr_multiplier)
+            return self._atr_stop_loss(entry_price, df, atr_multiplier, ctx=ctx)
         elif method == 'support':
-            return self._support_stop_loss(entry_price, df)
+            return self._support_stop_loss(entry_price, df, ctx=ctx)
         elif method == 'trailing':
-            return self._trailing_stop_loss(entry_price, df)
+            return self._trailing_stop_loss(entry_price, df, ctx=ctx)
         elif method == 'volatility':
-            return self._volatility_stop_loss(entry_price, df)
+            return self._volatility_stop_loss(entry_price, df, ctx=ctx)
         else:
             return self._percentage_stop_loss(entry_price, custom_pct)
     
     def _percentage_stop_loss(self, entry_price, stop_loss_pct=None):
         if stop_loss_pct is None:
-            stop_loss_pct = DEFAULT_STOP_LOSS_PCT
-        
-        stop_loss = entry_price * (1 - stop_loss_pct / 100)
+            stop_loss = entry_price * (1 - _SL)
+        else:
+            stop_loss = entry_price * (1 - stop_loss_pct / 100)
         
         return round(stop_loss, 2)
     
-    def _atr_stop_loss(self, entry_price, df, atr_multiplier=2.0):
-        if df is None or 'ATR' not in df.columns:
+    def _atr_stop_loss(self, entry_price, df, atr_multiplier=2.0, ctx=None):
+        if ctx is not None:
+            atr = ctx.atr_last
+        elif df is not None and 'ATR' in df.columns:
+            atr = float(df['ATR'].iloc[-1])
+        else:
+            atr = None
+        
+        if atr is None:
             self.logger.warning("ATR not available, using percentage method")
             return self._percentage_stop_loss(entry_price)
         
-        atr = df['ATR'].iloc[-1]
-        
         if atr <= 0:
             self.logger.warning("Invalid ATR value, using percentage method")
             return self._percentage_stop_loss(entry_price)
         
         stop_loss = entry_price - (atr * atr_multiplier)
         
-        min_stop = entry_price * (1 - DEFAULT_STOP_LOSS_PCT * 2 / 100)
+        min_stop = entry_price * (1 - _SL_2X)
         stop_loss = max(stop_loss, min_stop)
         
         return round(stop_loss, 2)
     
-    def _support_stop_loss(self, entry_price, df):
-        if df is None or len(df) < 20:
-            return self._percentage_stop_loss(entry_price)
+    def _support_stop_loss(self, entry_price, df, ctx=None):
+        if ctx is not None:
+            recent_low = ctx.low_min_20
+        elif df is not None and len(df) >= 20:
+            recent_low = _recent_low(df['Low'].to_numpy())
+        else:
+            recent_low = None
         
-        recent_low = df['Low'].tail(20).min()
+        if recent_low is None:
+            return self._percentage_stop_loss(entry_price)
         
         stop_loss = recent_low * 0.985
         
-        min_stop = entry_price * (1 - DEFAULT_STOP_LOSS_PCT * 1.5 / 100)
-        max_stop = entry_price * (1 - DEFAULT_STOP_LOSS_PCT * 0.5 / 100)
+        min_stop = entry_price * (1 - _SL_1_5X)
+        max_stop = entry_price * (1 - _SL_0_5X)
         
         stop_loss = max(min_stop, min(stop_loss, max_stop))
         
         return round(stop_loss, 2)
     
-    def _trailing_stop_loss(self, entry_price, df, trail_pct=None):
-        if trail_pct is None:
-            trail_pct = DEFAULT_STOP_LOSS_PCT * 0.6
+    def _trailing_stop_loss(self, entry_price, df, trail_pct=None, ctx=None):
+        trail_frac = _SL_0_6X if trail_pct is None else trail_pct / 100
         
-        if df is None or len(df) < 10:
-            return self._percentage_stop_loss(entry_price)
+        if ctx is not None:
+            highest_price = ctx.high_max_10
+        elif df is not None and len(df) >= 10:
+            highest_price = _recent_high(df['High'].to_numpy())
+        else:
+            highest_price = None
         
-        highest_price = df['High'].tail(10).max()
+        if highest_price is None:
+            return self._percentage_stop_loss(entry_price)
         
-        stop_loss = highest_price * (1 - trail_pct / 100)
+        stop_loss = highest_price * (1 - trail_frac)
         
-        min_stop = entry_price * (1 - DEFAULT_STOP_LOSS_PCT / 100)
+        min_stop = entry_price * (1 - _SL)
         stop_loss = max(stop_loss, min_stop)
         
         return round(stop_loss, 2)
     
-    def _volatility_stop_loss(self, entry_price, df):
-        if df is None or len(df) < 20:
-            return self._percentage_stop_loss(entry_price)
+    def _volatility_stop_loss(self, entry_price, df, ctx=None):
+        if ctx is not None:
+            volatility = ctx.volatility_20
+        elif df is not None and len(df) >= 20:
+            volatility = _recent_volatility(df['Close'].to_numpy())
+        else:
+            volatility = None
         
-        returns = df['Close'].pct_change().tail(20)
-        volatility = returns.std()
+        if volatility is None:
+            return self._percentage_stop_loss(entry_price)
         
-        volatility_adjusted_pct = DEFAULT_STOP_LOSS_PCT * (1 + volatility * 10)
-        volatility_adjusted_pct = min(volatility_adjusted_pct, DEFAULT_STOP_LOSS_PCT * 2)
+        volatility_adjusted = min(_SL * (1 + volatility * 10), _SL_2X)
         
-        stop_loss = entry_price * (1 - volatility_adjusted_pct / 100)
+        stop_loss = entry_price * (1 - volatility_adjusted)
         
         return round(stop_loss, 2)
     
@@ -112,38 +205,40 @@ class StopLossCalculator:
         if method == 'ratio':
             risk = entry_price - stop_loss
             if risk <= 0:
-                risk = entry_price * (DEFAULT_STOP_LOSS_PCT / 100)
+                risk = entry_price * _SL
             reward = risk * risk_reward_ratio
             take_profit = entry_price + reward
         
         elif method == 'percentage':
-            take_profit = entry_price * (1 + DEFAULT_TAKE_PROFIT_PCT / 100)
+            take_profit = entry_price * (1 + _TP)
         
         elif method == 'fibonacci':
             risk = entry_price - stop_loss
             if risk <= 0:
-                risk = entry_price * (DEFAULT_STOP_LOSS_PCT / 100)
+                risk = entry_price * _SL
             take_profit = entry_price + (risk * 1.618)
         
         elif method == 'resistance':
-            take_profit = entry_price * (1 + DEFAULT_TAKE_PROFIT_PCT / 100)
+            take_profit = entry_price * (1 + _TP)
         
         else:
-            take_profit = entry_price * (1 + DEFAULT_TAKE_PROFIT_PCT / 100)
+            take_profit = entry_price * (1 + _TP)
         
         return round(take_profit, 2)
     
-    def calculate_dynamic_levels(self, entry_price, df, volatility=None):
+    def calculate_dynamic_levels(self, entry_price, df, volatility=None, ctx=None):
         if df is None:
             stop_loss = self._percentage_stop_loss(entry_price)
-            risk = entry_price * (DEFAULT_STOP_LOSS_PCT / 100)
+            risk = entry_price * _SL
         else:
-            atr_stop = self._atr_stop_loss(entry_price, df)
-            support_stop = self._support_stop_loss(entry_price, df)
+            if ctx is None and isinstance(df, BarContext):
+                ctx = _build_stop_context(df)
+            atr_stop = self._atr_stop_loss(entry_price, df, ctx=ctx)
+            support_stop = self._support_stop_loss(entry_price, df, ctx=ctx)
             percentage_stop = self._percentage_stop_loss(entry_price)
             
             stops = [s for s in [atr_stop, support_stop, percentage_stop] if s > 0]
-            stop_loss = round(np.mean(stops), 2) if stops else percentage_stop
+            stop_loss = round(_mean(stops), 2) if stops else percentage_stop
             
             risk = entry_price - stop_loss
         
@@ -172,39 +267,35 @@ class StopLossCalculator:
     
     def calculate_time_based_stop(self, entry_price, days_held, max_days=30):
         if days_held >= max_days:
-            return self._percentage_stop_loss(entry_price, DEFAULT_STOP_LOSS_PCT * 1.5)
+            return round(entry_price * (1 - _SL_1_5X), 2)
         
         time_factor = days_held / max_days
-        adjusted_pct = DEFAULT_STOP_LOSS_PCT * (1 + time_factor * 0.5)
+        adjusted = _SL * (1 + time_factor * 0.5)
         
-        stop_loss = entry_price * (1 - adjusted_pct / 100)
+        stop_loss = entry_price * (1 - adjusted)
         
         return round(stop_loss, 2)
     
-    def get_stop_loss_recommendations(self, entry_price, df=None, risk_tolerance='Medium'):
+    def get_stop_loss_recommendations(self, entry_price, df=None, risk_tolerance='Medium', ctx=None):
         recommendations = {}
         
         recommendations['percentage'] = self._percentage_stop_loss(entry_price)
         
         if df is not None and len(df) >= 20:
-            recommendations['atr_based'] = self._atr_stop_loss(entry_price, df)
-            recommendations['support_based'] = self._support_stop_loss(entry_price, df)
-            recommendations['trailing'] = self._trailing_stop_loss(entry_price, df)
-            recommendations['volatility_adjusted'] = self._volatility_stop_loss(entry_price, df)
-        
-        risk_tolerance_map = {
-            'Low': DEFAULT_STOP_LOSS_PCT * 0.6,
-            'Medium': DEFAULT_STOP_LOSS_PCT,
-            'High': DEFAULT_STOP_LOSS_PCT * 1.4
-        }
-        
-        recommended_pct = risk_tolerance_map.get(risk_tolerance, DEFAULT_STOP_LOSS_PCT)
+            if ctx is None:
+                ctx = _build_stop_context(df)
+            recommendations['atr_based'] = self._atr_stop_loss(entry_price, df, ctx=ctx)
+            recommendations['support_based'] = self._support_stop_loss(entry_price, df, ctx=ctx)
+            recommendations['trailing'] = self._trailing_stop_loss(entry_price, df, ctx=ctx)
+            recommendations['volatility_adjusted'] = self._volatility_stop_loss(entry_price, df, ctx=ctx)
+        
+        recommended_pct = _RISK_TOLERANCE_PCT.get(risk_tolerance, DEFAULT_STOP_LOSS_PCT)
         recommendations['recommended'] = self._percentage_stop_loss(entry_price, recommended_pct)
         
         if df is not None and len(df) >= 20:
             all_stops = [v for k, v in recommendations.items() if k != 'recommended' and v > 0]
             if all_stops:
-                recommendations['average_technical'] = round(np.mean(all_stops), 2)
+                recommendations['average_technical'] = round(_mean(all_stops), 2)
         
         return recommendations
     
@@ -265,24 +356,36 @@ class StopLossCalculator:
             self.logger.error("Invalid risk calculation")
             return []
         
-        exit_strategy = []
+        exit_numbers, position_pcts, rr_ratios = _exit_ladder(num_exits)
+        target_prices = entry_price + risk * rr_ratios
+        
+        return [
+            {
+                'exit_number': int(exit_numbers[k]),
+                'target_price': round(float(target_prices[k]), 2),
+                'position_percentage': round(float(position_pcts[k]), 1),
+                'risk_reward_ratio': round(float(rr_ratios[k]), 2),
+                'description': self._get_exit_description(k + 1, num_exits)
+            }
+            for k in range(num_exits)
+        ]
+    
+    def calculate_multiple_exit_strategy_batch(self, entry_prices, stop_losses, num_exits=3):
+        entry_prices = np.asarray(entry_prices, dtype=float)
+        stop_losses = np.asarray(stop_losses, dtype=float)
         
-        for i in range(1, num_exits + 1):
-            target_price = entry_price + (risk * i * 1.5)
-            position_pct = 100 / num_exits
-            
-            if i == num_exits:
-                position_pct = 100 - (position_pct * (num_exits - 1))
-            
-            exit_strategy.append({
-                'exit_number': i,
-                'target_price': round(target_price, 2),
-                'position_percentage': round(position_pct, 1),
-                'risk_reward_ratio': round(i * 1.5, 2),
-                'description': self._get_exit_description(i, num_exits)
-            })
-        
-        return exit_strategy
+        risk = entry_prices - stop_losses
+        risk = np.where(risk > 0, risk, np.nan)
+        
+        exit_numbers, position_pcts, rr_ratios = _exit_ladder(num_exits)
+        target_prices = entry_prices[..., np.newaxis] + risk[..., np.newaxis] * rr_ratios
+        
+        return {
+            'exit_numbers': exit_numbers,
+            'target_prices': np.round(target_prices, 2),
+            'position_percentages': np.round(position_pcts, 1),
+            'risk_reward_ratios': np.round(rr_ratios, 2)
+        }
     
     def _get_exit_description(self, exit_num, total_exits):
         if exit_num == 1:
@@ -303,24 +406,36 @@ class StopLossCalculator:
             self.logger.info(f"Moving stop to breakeven at {new_stop:.2f}")
             return round(new_stop, 2)
         
-        trailing_pct = DEFAULT_STOP_LOSS_PCT * 0.5
-        new_trailing_stop = current_price * (1 - trailing_pct / 100)
+        new_trailing_stop = current_price * (1 - _SL_0_5X)
         
         adjusted_stop = max(current_stop, new_trailing_stop)
         
         return round(adjusted_stop, 2)
     
     def calculate_chandelier_stop(self, df, entry_price, atr_multiplier=3.0, lookback=22):
-        if df is None or 'ATR' not in df.columns or len(df) < lookback:
-            self.logger.warning("Insufficient data for Chandelier stop, using ATR method")
-            return self._atr_stop_loss(entry_price, df, atr_multiplier)
+        if isinstance(df, BarContext):
+            if df.atr is None or df.high_hist is None or len(df) < lookback:
+                self.logger.warning("Insufficient data for Chandelier stop, using ATR method")
+                return self._atr_stop_loss(entry_price, df, atr_multiplier, ctx=_build_stop_context(df))
+            
+            if lookback > len(df.high_hist):
+                raise ValueError(f"BarContext holds {len(df.high_hist)} highs, Chandelier lookback={lookback} needs a DataFrame")
+            
+            highs = df.high_hist
+            atr = df.atr
+        else:
+            if df is None or 'ATR' not in df.columns or len(df) < lookback:
+                self.logger.warning("Insufficient data for Chandelier stop, using ATR method")
+                return self._atr_stop_loss(entry_price, df, atr_multiplier)
+            
+            highs = df['High'].to_numpy()
+            atr = float(df['ATR'].iloc[-1])
         
-        highest_high = df['High'].tail(lookback).max()
-        atr = df['ATR'].iloc[-1]
+        highest_high = float(highs[-lookback:].max())
         
         chandelier_stop = highest_high - (atr * atr_multiplier)
         
-        min_stop = entry_price * (1 - DEFAULT_STOP_LOSS_PCT * 2 / 100)
+        min_stop = entry_price * (1 - _SL_2X)
         chandelier_stop = max(chandelier_stop, min_stop)
         
         return round(chandelier_stop, 2)
@@ -332,19 +447,26 @@ class StopLossCalculator:
         acceleration = 0.02
         max_acceleration = 0.20
         
-        sar = df['Low'].iloc[-5]
-        extreme_point = df['High'].iloc[-5]
+        if isinstance(df, BarContext):
+            highs = df.high_hist[-5:].tolist()
+            lows = df.low_hist[-5:].tolist()
+        else:
+            highs = df['High'].to_numpy()[-5:].tolist()
+            lows = df['Low'].to_numpy()[-5:].tolist()
         
-        for i in range(-4, 0):
+        sar = lows[0]
+        extreme_point = highs[0]
+        
+        for i in range(1, 5):
             sar = sar + acceleration * (extreme_point - sar)
             
-            if df['High'].iloc[i] > extreme_point:
-                extreme_point = df['High'].iloc[i]
+            if highs[i] > extreme_point:
+                extreme_point = highs[i]
                 acceleration = min(acceleration + 0.02, max_acceleration)
             
-            sar = min(sar, df['Low'].iloc[i], df['Low'].iloc[i-1])
+            sar = min(sar, lows[i], lows[i-1])
         
-        min_stop = entry_price * (1 - DEFAULT_STOP_LOSS_PCT * 1.5 / 100)
+        min_stop = entry_price * (1 - _SL_1_5X)
         sar_stop = max(sar, min_stop)
         
         return round(sar_stop, 2)
@@ -358,7 +480,9 @@ class StopLossCalculator:
             'confidence_score': 0
         }
         
-        recommendations = self.get_stop_loss_recommendations(entry_price, df, risk_tolerance)
+        ctx = _build_stop_context(df) if df is not None else None
+        
+        recommendations = self.get_stop_loss_recommendations(entry_price, df, risk_tolerance, ctx=ctx)
         analysis['recommendations'] = recommendations
         
         if df is not None and len(df) >= 20:
@@ -370,10 +494,14 @@ class StopLossCalculator:
             technical_stops = [s for s in technical_stops if s > 0]
             
             if technical_stops:
-                analysis['optimal_stop'] = round(np.median(technical_stops), 2)
+                if len(technical_stops) == 3:
+                    median_stop = _median3(*technical_stops)
+                else:
+                    median_stop = _mean(technical_stops)
+                analysis['optimal_stop'] = round(median_stop, 2)
                 
-                std_dev = np.std(technical_stops)
-                avg_stop = np.mean(technical_stops)
+                std_dev = _std(technical_stops)
+                avg_stop = _mean(technical_stops)
                 analysis['confidence_score'] = max(0, min(100, 100 - (std_dev / avg_stop * 100)))
             else:
                 analysis['optimal_stop'] = recommendations['recommended']
@@ -385,7 +513,7 @@ class StopLossCalculator:
         validation = self.validate_stop_loss(entry_price, analysis['optimal_stop'])
         analysis['validation'] = validation
         
-        dynamic_levels = self.calculate_dynamic_levels(entry_price, df)
+        dynamic_levels = self.calculate_dynamic_levels(entry_price, df, ctx=ctx)
         analysis['dynamic_levels'] = dynamic_levels
         
         return analysis
\ No newline at end of file
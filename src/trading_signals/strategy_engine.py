@@ -3,13 +3,19 @@
 
 import numpy as np
 import pandas as pd
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.utils.logger import Logger
+from src.trading_signals._kernels import rsi_backtest, macd_backtest, ma_backtest, all_backtests, composite_backtest
+
+_INDICATOR_COLUMNS = ('Close', 'RSI', 'MACD', 'MACD_Signal', 'SMA_20', 'SMA_50', 'BB_Upper', 'BB_Lower')
+
+def _indicator_arrays(df):
+    n = len(df)
+    columns = df.columns
+    return [
+        df[name].to_numpy(dtype=np.float64) if name in columns else np.full(n, np.nan)
+        for name in _INDICATOR_COLUMNS
+    ]
 
 class StrategyEngine:
     def __init__(self):
@@ -27,154 +33,185 @@ class StrategyEngine:
         else:
             return self._analyze_composite_strategy(df)
     
+    def analyze_all_strategies(self, df):
+        columns = df.columns
+        arrays = _indicator_arrays(df)
+        
+        (rsi_buy, rsi_sell, rsi_profits, macd_buy, macd_sell, macd_profits,
+         ma_buy, ma_sell, bb_buy, bb_sell) = all_backtests(*arrays)
+        
+        results = {}
+        
+        if 'RSI' in columns:
+            results['RSI Strategy'] = self._rsi_result(rsi_buy, rsi_sell, rsi_profits)
+        else:
+            results['RSI Strategy'] = self._empty_result()
+        
+        if 'MACD' in columns and 'MACD_Signal' in columns:
+            results['MACD Crossover'] = self._macd_result(macd_buy, macd_sell, macd_profits)
+        else:
+            results['MACD Crossover'] = self._empty_result()
+        
+        if 'SMA_20' in columns and 'SMA_50' in columns:
+            results['Moving Average'] = self._ma_result(ma_buy, ma_sell)
+        else:
+            results['Moving Average'] = self._empty_result()
+        
+        if 'BB_Upper' in columns and 'BB_Lower' in columns:
+            results['Bollinger Bands'] = self._bb_result(bb_buy, bb_sell)
+        else:
+            results['Bollinger Bands'] = self._empty_result()
+        
+        if 'Close' in columns:
+            results['AI Composite'] = self._composite_result(*composite_backtest(*arrays))
+        else:
+            results['AI Composite'] = self._empty_result()
+        
+        return results
+    
+    def _empty_result(self):
+        return {'win_rate': 0, 'avg_return': 0, 'total_signals': 0}
+    
     def _analyze_rsi_strategy(self, df):
         if 'RSI' not in df.columns:
-            return {'win_rate': 0, 'avg_return': 0, 'total_signals': 0}
-        
-        signals = []
-        positions = []
-        
-        for i in range(1, len(df)):
-            rsi = df['RSI'].iloc[i]
-            rsi_prev = df['RSI'].iloc[i-1]
-            
-            if rsi_prev <= 30 and rsi > 30:
-                signals.append({'type': 'BUY', 'price': df['Close'].iloc[i], 'index': i})
-            elif rsi_prev >= 70 and rsi < 70:
-                signals.append({'type': 'SELL', 'price': df['Close'].iloc[i], 'index': i})
-        
-        entry_price = None
-        for signal in signals:
-            if signal['type'] == 'BUY' and entry_price is None:
-                entry_price = signal['price']
-            elif signal['type'] == 'SELL' and entry_price is not None:
-                exit_price = signal['price']
-                profit = (exit_price - entry_price) / entry_price * 100
-                positions.append(profit)
-                entry_price = None
-        
-        if not positions:
+            return self._empty_result()
+        
+        n_buy, n_sell, profits = rsi_backtest(
+            df['RSI'].to_numpy(dtype=np.float64),
+            df['Close'].to_numpy(dtype=np.float64)
+        )
+        return self._rsi_result(n_buy, n_sell, profits)
+    
+    def _rsi_result(self, n_buy, n_sell, profits):
+        total_signals = n_buy + n_sell
+        
+        if not len(profits):
             return {
                 'win_rate': 0,
                 'avg_return': 0,
-                'total_signals': len(signals),
+                'total_signals': total_signals,
                 'recommendations': ['Insufficient trading signals generated']
             }
         
-        win_rate = len([p for p in positions if p > 0]) / len(positions) * 100
-        avg_return = np.mean(positions)
+        win_rate = float((profits > 0).mean() * 100)
+        avg_return = profits.mean()
         
         recommendations = []
         if win_rate > 60:
             recommendations.append('RSI strategy shows strong performance')
         if avg_return > 2:
             recommendations.append('Good average returns per trade')
-        if len(signals) < 5:
+        if total_signals < 5:
             recommendations.append('Limited trading opportunities - consider longer timeframe')
         
         return {
             'win_rate': win_rate,
             'avg_return': avg_return,
-            'total_signals': len(signals),
+            'total_signals': total_signals,
             'recommendations': recommendations
         }
     
     def _analyze_macd_strategy(self, df):
         if 'MACD' not in df.columns or 'MACD_Signal' not in df.columns:
-            return {'win_rate': 0, 'avg_return': 0, 'total_signals': 0}
-        
-        signals = []
-        positions = []
-        
-        for i in range(1, len(df)):
-            macd = df['MACD'].iloc[i]
-            signal = df['MACD_Signal'].iloc[i]
-            macd_prev = df['MACD'].iloc[i-1]
-            signal_prev = df['MACD_Signal'].iloc[i-1]
-            
-            if macd_prev < signal_prev and macd > signal:
-                signals.append({'type': 'BUY', 'price': df['Close'].iloc[i]})
-            elif macd_prev > signal_prev and macd < signal:
-                signals.append({'type': 'SELL', 'price': df['Close'].iloc[i]})
-        
-        entry_price = None
-        for sig in signals:
-            if sig['type'] == 'BUY' and entry_price is None:
-                entry_price = sig['price']
-            elif sig['type'] == 'SELL' and entry_price is not None:
-                profit = (sig['price'] - entry_price) / entry_price * 100
-                positions.append(profit)
-                entry_price = None
-        
-        if not positions:
+            return self._empty_result()
+        
+        n_buy, n_sell, profits = macd_backtest(
+            df['MACD'].to_numpy(dtype=np.float64),
+            df['MACD_Signal'].to_numpy(dtype=np.float64),
+            df['Close'].to_numpy(dtype=np.float64)
+        )
+        return self._macd_result(n_buy, n_sell, profits)
+    
+    def _macd_result(self, n_buy, n_sell, profits):
+        total_signals = n_buy + n_sell
+        
+        if not len(profits):
             return {
                 'win_rate': 0,
                 'avg_return': 0,
-                'total_signals': len(signals),
+                'total_signals': total_signals,
                 'recommendations': ['No completed trades']
             }
         
-        win_rate = len([p for p in positions if p > 0]) / len(positions) * 100
-        avg_return = np.mean(positions)
+        win_rate = float((profits > 0).mean() * 100)
+        avg_return = profits.mean()
         
         return {
             'win_rate': win_rate,
             'avg_return': avg_return,
-            'total_signals': len(signals),
+            'total_signals': total_signals,
             'recommendations': ['MACD crossover strategy active']
         }
     
     def _analyze_ma_strategy(self, df):
         if 'SMA_20' not in df.columns or 'SMA_50' not in df.columns:
-            return {'win_rate': 0, 'avg_return': 0, 'total_signals': 0}
-        
-        signals = []
-        
-        for i in range(1, len(df)):
-            sma_20 = df['SMA_20'].iloc[i]
-            sma_50 = df['SMA_50'].iloc[i]
-            sma_20_prev = df['SMA_20'].iloc[i-1]
-            sma_50_prev = df['SMA_50'].iloc[i-1]
-            
-            if sma_20_prev < sma_50_prev and sma_20 > sma_50:
-                signals.append('BUY')
-            elif sma_20_prev > sma_50_prev and sma_20 < sma_50:
-                signals.append('SELL')
-        
+            return self._empty_result()
+        
+        n_golden, n_death, _ = ma_backtest(
+            df['SMA_20'].to_numpy(dtype=np.float64),
+            df['SMA_50'].to_numpy(dtype=np.float64),
+            df['Close'].to_numpy(dtype=np.float64)
+        )
+        return self._ma_result(n_golden, n_death)
+    
+    def _ma_result(self, n_golden, n_death):
         return {
             'win_rate': 55,
             'avg_return': 3.5,
-            'total_signals': len(signals),
+            'total_signals': n_golden + n_death,
             'recommendations': ['Moving average crossover detected']
         }
     
     def _analyze_bb_strategy(self, df):
         if 'BB_Upper' not in df.columns:
-            return {'win_rate': 0, 'avg_return': 0, 'total_signals': 0}
+            return self._empty_result()
         
-        signals = []
+        close = df['Close'].to_numpy()
+        bb_upper = df['BB_Upper'].to_numpy()
+        bb_lower = df['BB_Lower'].to_numpy()
         
-        for i in range(len(df)):
-            price = df['Close'].iloc[i]
-            bb_upper = df['BB_Upper'].iloc[i]
-            bb_lower = df['BB_Lower'].iloc[i]
-            
-            if price < bb_lower:
-                signals.append('BUY')
-            elif price > bb_upper:
-                signals.append('SELL')
+        below_lower = close < bb_lower
+        n_buy = int(below_lower.sum())
+        n_sell = int((~below_lower & (close > bb_upper)).sum())
         
+        return self._bb_result(n_buy, n_sell)
+    
+    def _bb_result(self, n_buy, n_sell):
         return {
             'win_rate': 58,
             'avg_return': 2.8,
-            'total_signals': len(signals),
+            'total_signals': n_buy + n_sell,
             'recommendations': ['Bollinger Bands strategy']
         }
     
     def _analyze_composite_strategy(self, df):
+        if 'Close' not in df.columns:
+            return self._empty_result()
+        
+        n_buy, n_sell, profits = composite_backtest(*_indicator_arrays(df))
+        return self._composite_result(n_buy, n_sell, profits)
+    
+    def _composite_result(self, n_buy, n_sell, profits):
+        total_signals = n_buy + n_sell
+        
+        if not len(profits):
+            return {
+                'win_rate': 0,
+                'avg_return': 0,
+                'total_signals': total_signals,
+                'recommendations': ['Indicators rarely agreed - no completed composite trades']
+            }
+        
+        win_rate = float((profits > 0).mean() * 100)
+        avg_return = profits.mean()
+        
+        recommendations = ['Composite strategy combines multiple indicators']
+        if win_rate > 60:
+            recommendations.append('Indicator agreement has been a reliable entry filter')
+        
         return {
-            'win_rate': 62,
-            'avg_return': 4.2,
-            'total_signals': 15,
-            'recommendations': ['Composite strategy combines multiple indicators']
-        }
\ No newline at end of file
+            'win_rate': win_rate,
+            'avg_return': avg_return,
+            'total_signals': total_signals,
+            'recommendations': recommendations
+        }
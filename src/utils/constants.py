@@ -1,29 +1,25 @@
 # src/utils/constants.py
 
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+from types import MappingProxyType
 
 class Constants:
-    STOCK_EXCHANGES = {
+    STOCK_EXCHANGES = MappingProxyType({
         'NYSE': 'New York Stock Exchange',
         'NASDAQ': 'NASDAQ Stock Market',
         'AMEX': 'American Stock Exchange',
         'LSE': 'London Stock Exchange',
         'TSE': 'Tokyo Stock Exchange'
-    }
+    })
     
-    MAJOR_INDICES = {
+    MAJOR_INDICES = MappingProxyType({
         '^GSPC': 'S&P 500',
         '^DJI': 'Dow Jones Industrial Average',
         '^IXIC': 'NASDAQ Composite',
         '^RUT': 'Russell 2000',
         '^VIX': 'CBOE Volatility Index'
-    }
+    })
     
-    SECTORS = [
+    SECTORS = (
         'Technology',
         'Healthcare',
         'Financial Services',
@@ -35,22 +31,22 @@ class Constants:
         'Real Estate',
         'Basic Materials',
         'Utilities'
-    ]
+    )
     
-    TECHNICAL_INDICATORS = [
+    TECHNICAL_INDICATORS = (
         'SMA', 'EMA', 'RSI', 'MACD', 'Bollinger Bands',
         'ATR', 'Stochastic', 'CCI', 'ADX', 'Williams %R'
-    ]
+    )
     
-    TIMEFRAMES = {
+    TIMEFRAMES = MappingProxyType({
         '1d': 'Daily',
         '1wk': 'Weekly',
         '1mo': 'Monthly',
         '3mo': 'Quarterly',
         '1y': 'Yearly'
-    }
+    })
     
-    PERIODS = {
+    PERIODS = MappingProxyType({
         '1d': 1,
         '5d': 5,
         '1mo': 30,
@@ -61,49 +57,49 @@ class Constants:
         '5y': 1825,
         '10y': 3650,
         'max': 7300
-    }
+    })
     
-    RISK_LEVELS = {
+    RISK_LEVELS = MappingProxyType({
         'Very Low': 0,
         'Low': 1,
         'Medium': 2,
         'High': 3,
         'Very High': 4
-    }
+    })
     
-    TRADING_SIGNALS = ['BUY', 'SELL', 'HOLD', 'STRONG BUY', 'STRONG SELL']
+    TRADING_SIGNALS = ('BUY', 'SELL', 'HOLD', 'STRONG BUY', 'STRONG SELL')
     
-    MODEL_TYPES = [
+    MODEL_TYPES = (
         'Linear Regression',
         'Random Forest',
         'XGBoost',
         'LSTM',
         'Ensemble'
-    ]
+    )
     
-    ALERT_CONDITIONS = ['Above', 'Below', 'Equals', 'Change %']
+    ALERT_CONDITIONS = ('Above', 'Below', 'Equals', 'Change %')
     
-    NOTIFICATION_METHODS = ['Email', 'Telegram', 'Discord', 'SMS', 'Push']
+    NOTIFICATION_METHODS = ('Email', 'Telegram', 'Discord', 'SMS', 'Push')
     
-    SUPPORTED_CURRENCIES = ['USD', 'EUR', 'GBP', 'JPY', 'CAD', 'AUD', 'CHF']
+    SUPPORTED_CURRENCIES = ('USD', 'EUR', 'GBP', 'JPY', 'CAD', 'AUD', 'CHF')
     
-    DATE_FORMATS = {
+    DATE_FORMATS = MappingProxyType({
         'US': '%m/%d/%Y',
         'EU': '%d/%m/%Y',
         'ISO': '%Y-%m-%d',
         'LONG': '%B %d, %Y',
         'SHORT': '%m/%d/%y'
-    }
+    })
     
-    NUMBER_FORMATS = {
+    NUMBER_FORMATS = MappingProxyType({
         'decimal': '{:,.2f}',
         'integer': '{:,}',
         'percentage': '{:.2f}%',
         'currency': '${:,.2f}',
         'scientific': '{:.2e}'
-    }
+    })
     
-    HTTP_STATUS_CODES = {
+    HTTP_STATUS_CODES = MappingProxyType({
         200: 'OK',
         201: 'Created',
         400: 'Bad Request',
@@ -112,31 +108,31 @@ class Constants:
         404: 'Not Found',
         500: 'Internal Server Error',
         503: 'Service Unavailable'
-    }
+    })
     
-    FILE_EXTENSIONS = {
-        'csv': ['.csv'],
-        'excel': ['.xlsx', '.xls'],
-        'json': ['.json'],
-        'pickle': ['.pkl', '.pickle'],
-        'image': ['.png', '.jpg', '.jpeg', '.gif'],
-        'document': ['.pdf', '.doc', '.docx']
-    }
+    FILE_EXTENSIONS = MappingProxyType({
+        'csv': ('.csv',),
+        'excel': ('.xlsx', '.xls'),
+        'json': ('.json',),
+        'pickle': ('.pkl', '.pickle'),
+        'image': ('.png', '.jpg', '.jpeg', '.gif'),
+        'document': ('.pdf', '.doc', '.docx')
+    })
     
     MAX_FILE_SIZE_MB = 100
     
     DEFAULT_PAGINATION_SIZE = 20
     
-    CACHE_TTL_SECONDS = {
+    CACHE_TTL_SECONDS = MappingProxyType({
         'realtime': 60,
         'intraday': 300,
         'daily': 3600,
         'weekly': 86400
-    }
+    })
     
-    API_RATE_LIMITS = {
+    API_RATE_LIMITS = MappingProxyType({
         'yfinance': 2000,
         'alpha_vantage': 5,
         'news_api': 1000,
         'finnhub': 60
-    }
\ No newline at end of file
+    })
\ No newline at end of file
@@ -1,11 +1,6 @@
 # src/utils/error_handlers.py
 
 import traceback
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.utils.logger import Logger
 
@@ -1,15 +1,165 @@
 # src/utils/formatters.py
 
+from bisect import bisect_right
 from datetime import datetime
+import functools
 import locale
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+import math
 
 from src.utils.logger import Logger
 
+_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+_TIME_AGO_THRESHOLDS = (60, 3600, 86400, 2592000, 31536000)
+_TIME_AGO_UNITS = (None, (60, 'minute'), (3600, 'hour'), (86400, 'day'), (2592000, 'month'), (31536000, 'year'))
+
+_DURATION_THRESHOLDS = (60, 3600)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_datetime(date_string, date_format):
+    if (date_format == '%Y-%m-%d' and len(date_string) == 10 and date_string.isascii()
+            and date_string[4] == date_string[7] == '-' and date_string[:4].isdigit()
+            and date_string[5:7].isdigit() and date_string[8:].isdigit()):
+        return datetime.fromisoformat(date_string)
+    return datetime.strptime(date_string, date_format)
+
+_MAGNITUDES = (('', 1), ('K', 1_000), ('M', 1_000_000), ('B', 1_000_000_000), ('T', 1_000_000_000_000))
+
+def format_currency(amount, currency_symbol='$', decimal_places=2):
+    try:
+        return f"{currency_symbol}{amount:,.{decimal_places}f}"
+    except:
+        return f"{currency_symbol}0.00"
+
+def format_number(number, decimal_places=0):
+    try:
+        return f"{number:,.{decimal_places}f}"
+    except:
+        return "0"
+
+def format_percentage(value, decimal_places=2, include_sign=False):
+    try:
+        if include_sign:
+            return f"{value:+.{decimal_places}f}%"
+        return f"{value:.{decimal_places}f}%"
+    except:
+        return "0.00%"
+
+def format_large_number(number):
+    try:
+        abs_num = abs(number)
+        sign = '-' if number < 0 else ''
+        
+        if not abs_num >= 1_000:
+            return f"{sign}{abs_num:.2f}"
+        
+        exponent = math.log10(abs_num)
+        idx = 4 if exponent >= 12 else int(exponent) // 3
+        if abs_num < _MAGNITUDES[idx][1]:
+            idx -= 1
+        
+        suffix, divisor = _MAGNITUDES[idx]
+        return f"{sign}{abs_num/divisor:.2f}{suffix}"
+    except:
+        return "0"
+
+def format_date(date, format_type='ISO'):
+    try:
+        if isinstance(date, str):
+            date = _parse_datetime(date, '%Y-%m-%d')
+        
+        formats = {
+            'ISO': '%Y-%m-%d',
+            'US': '%m/%d/%Y',
+            'EU': '%d/%m/%Y',
+            'LONG': '%B %d, %Y',
+            'SHORT': '%m/%d/%y',
+            'DATETIME': '%Y-%m-%d %H:%M:%S'
+        }
+        
+        date_format = formats.get(format_type, '%Y-%m-%d')
+        return date.strftime(date_format)
+    except:
+        return ''
+
+def format_time_ago(date):
+    try:
+        if isinstance(date, str):
+            date = _parse_datetime(date, '%Y-%m-%d %H:%M:%S')
+        
+        now = datetime.now()
+        diff = now - date
+        
+        seconds = diff.total_seconds()
+        
+        bucket = bisect_right(_TIME_AGO_THRESHOLDS, seconds)
+        if bucket == 0:
+            return "just now"
+        
+        unit_seconds, unit = _TIME_AGO_UNITS[bucket]
+        count = int(seconds / unit_seconds)
+        return f"{count} {unit}{'s' if count != 1 else ''} ago"
+    except:
+        return ''
+
+def format_duration(seconds):
+    try:
+        bucket = bisect_right(_DURATION_THRESHOLDS, seconds)
+        if bucket == 0:
+            return f"{int(seconds)}s"
+        elif bucket == 1:
+            return f"{int(seconds / 60)}m {int(seconds % 60)}s"
+        return f"{int(seconds / 3600)}h {int((seconds % 3600) / 60)}m"
+    except:
+        return "0s"
+
+def format_file_size(bytes_size):
+    try:
+        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+            if bytes_size < 1024.0:
+                return f"{bytes_size:.2f} {unit}"
+            bytes_size /= 1024.0
+        return f"{bytes_size:.2f} PB"
+    except:
+        return "0 B"
+
+def parse_date(date_string, input_format='%Y-%m-%d'):
+    try:
+        return _parse_datetime(date_string, input_format)
+    except:
+        return None
+
+def parse_number(number_string):
+    try:
+        cleaned = number_string.replace(',', '').replace('$', '').strip()
+        return float(cleaned)
+    except:
+        return 0.0
+
+def format_ticker(ticker):
+    if not ticker:
+        return ''
+    return ticker.upper().strip()
+
+def format_phone_number(phone, country_code='US'):
+    try:
+        if phone.isascii():
+            digits = phone.translate(_NON_DIGITS)
+        else:
+            digits = ''.join(filter(str.isdigit, phone))
+        
+        if country_code == 'US' and len(digits) == 10:
+            return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+        
+        return phone
+    except:
+        return phone
+
+def truncate_text(text, max_length, suffix='...'):
+    if len(text) <= max_length:
+        return text
+    return f"{text[:max_length - len(suffix)]}{suffix}"
+
 class Formatters:
     def __init__(self):
         self.logger = Logger(__name__)
@@ -18,161 +168,16 @@ class Formatters:
         except:
             pass
     
-    @staticmethod
-    def format_currency(amount, currency_symbol='$', decimal_places=2):
-        try:
-            return f"{currency_symbol}{amount:,.{decimal_places}f}"
-        except:
-            return f"{currency_symbol}0.00"
-    
-    @staticmethod
-    def format_number(number, decimal_places=0):
-        try:
-            return f"{number:,.{decimal_places}f}"
-        except:
-            return "0"
-    
-    @staticmethod
-    def format_percentage(value, decimal_places=2, include_sign=False):
-        try:
-            if include_sign:
-                return f"{value:+.{decimal_places}f}%"
-            return f"{value:.{decimal_places}f}%"
-        except:
-            return "0.00%"
-    
-    @staticmethod
-    def format_large_number(number):
-        try:
-            abs_num = abs(number)
-            sign = '-' if number < 0 else ''
-            
-            if abs_num >= 1_000_000_000_000:
-                return f"{sign}{abs_num/1_000_000_000_000:.2f}T"
-            elif abs_num >= 1_000_000_000:
-                return f"{sign}{abs_num/1_000_000_000:.2f}B"
-            elif abs_num >= 1_000_000:
-                return f"{sign}{abs_num/1_000_000:.2f}M"
-            elif abs_num >= 1_000:
-                return f"{sign}{abs_num/1_000:.2f}K"
-            else:
-                return f"{sign}{abs_num:.2f}"
-        except:
-            return "0"
-    
-    @staticmethod
-    def format_date(date, format_type='ISO'):
-        try:
-            if isinstance(date, str):
-                date = datetime.strptime(date, '%Y-%m-%d')
-            
-            formats = {
-                'ISO': '%Y-%m-%d',
-                'US': '%m/%d/%Y',
-                'EU': '%d/%m/%Y',
-                'LONG': '%B %d, %Y',
-                'SHORT': '%m/%d/%y',
-                'DATETIME': '%Y-%m-%d %H:%M:%S'
-            }
-            
-            date_format = formats.get(format_type, '%Y-%m-%d')
-            return date.strftime(date_format)
-        except:
-            return ''
-    
-    @staticmethod
-    def format_time_ago(date):
-        try:
-            if isinstance(date, str):
-                date = datetime.strptime(date, '%Y-%m-%d %H:%M:%S')
-            
-            now = datetime.now()
-            diff = now - date
-            
-            seconds = diff.total_seconds()
-            
-            if seconds < 60:
-                return "just now"
-            elif seconds < 3600:
-                minutes = int(seconds / 60)
-                return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-            elif seconds < 86400:
-                hours = int(seconds / 3600)
-                return f"{hours} hour{'s' if hours != 1 else ''} ago"
-            elif seconds < 2592000:
-                days = int(seconds / 86400)
-                return f"{days} day{'s' if days != 1 else ''} ago"
-            elif seconds < 31536000:
-                months = int(seconds / 2592000)
-                return f"{months} month{'s' if months != 1 else ''} ago"
-            else:
-                years = int(seconds / 31536000)
-                return f"{years} year{'s' if years != 1 else ''} ago"
-        except:
-            return ''
-    
-    @staticmethod
-    def format_duration(seconds):
-        try:
-            if seconds < 60:
-                return f"{int(seconds)}s"
-            elif seconds < 3600:
-                minutes = int(seconds / 60)
-                secs = int(seconds % 60)
-                return f"{minutes}m {secs}s"
-            else:
-                hours = int(seconds / 3600)
-                minutes = int((seconds % 3600) / 60)
-                return f"{hours}h {minutes}m"
-        except:
-            return "0s"
-    
-    @staticmethod
-    def format_file_size(bytes_size):
-        try:
-            for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                if bytes_size < 1024.0:
-                    return f"{bytes_size:.2f} {unit}"
-                bytes_size /= 1024.0
-            return f"{bytes_size:.2f} PB"
-        except:
-            return "0 B"
-    
-    @staticmethod
-    def parse_date(date_string, input_format='%Y-%m-%d'):
-        try:
-            return datetime.strptime(date_string, input_format)
-        except:
-            return None
-    
-    @staticmethod
-    def parse_number(number_string):
-        try:
-            cleaned = number_string.replace(',', '').replace('$', '').strip()
-            return float(cleaned)
-        except:
-            return 0.0
-    
-    @staticmethod
-    def format_ticker(ticker):
-        if not ticker:
-            return ''
-        return ticker.upper().strip()
-    
-    @staticmethod
-    def format_phone_number(phone, country_code='US'):
-        try:
-            digits = ''.join(filter(str.isdigit, phone))
-            
-            if country_code == 'US' and len(digits) == 10:
-                return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
-            
-            return phone
-        except:
-            return phone
-    
-    @staticmethod
-    def truncate_text(text, max_length, suffix='...'):
-        if len(text) <= max_length:
-            return text
-        return text[:max_length - len(suffix)] + suffix
\ No newline at end of file
+    format_currency = staticmethod(format_currency)
+    format_number = staticmethod(format_number)
+    format_percentage = staticmethod(format_percentage)
+    format_large_number = staticmethod(format_large_number)
+    format_date = staticmethod(format_date)
+    format_time_ago = staticmethod(format_time_ago)
+    format_duration = staticmethod(format_duration)
+    format_file_size = staticmethod(format_file_size)
+    parse_date = staticmethod(parse_date)
+    parse_number = staticmethod(parse_number)
+    format_ticker = staticmethod(format_ticker)
+    format_phone_number = staticmethod(format_phone_number)
+    truncate_text = staticmethod(truncate_text)
\ No newline at end of file
@@ -1,144 +1,176 @@
 # src/utils/helpers.py
 
+from concurrent.futures import ProcessPoolExecutor
 import hashlib
 import uuid
+import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
 import re
 from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.utils.logger import Logger
+from src.utils.formatters import truncate_text
 
-class Helpers:
-    def __init__(self):
-        self.logger = Logger(__name__)
-    
-    @staticmethod
-    def generate_unique_id():
-        return str(uuid.uuid4())
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\s\-\.]')
+_WHITESPACE_RUN = re.compile(r'[\s]+')
+
+def generate_unique_id():
+    return str(uuid.uuid4())
+
+def generate_hash(text):
+    return hashlib.sha256(text.encode()).hexdigest()
+
+def calculate_percentage_change(old_value, new_value):
+    if old_value == 0:
+        return 0
+    return ((new_value - old_value) / old_value) * 100
+
+def clamp(value, min_value, max_value):
+    return max(min_value, min(value, max_value))
+
+def safe_divide(numerator, denominator, default=0):
+    try:
+        if denominator == 0:
+            return default
+        return numerator / denominator
+    except:
+        return default
+
+def _to_day(timestamp):
+    return timestamp.normalize().to_datetime64().astype('M8[D]')
+
+def get_business_days(start_date, end_date):
+    start = pd.Timestamp(start_date)
+    end = pd.Timestamp(end_date)
     
-    @staticmethod
-    def generate_hash(text):
-        return hashlib.sha256(text.encode()).hexdigest()
+    last_day = _to_day(end)
+    if end - end.normalize() < start - start.normalize():
+        last_day -= 1
     
-    @staticmethod
-    def calculate_percentage_change(old_value, new_value):
-        if old_value == 0:
-            return 0
-        return ((new_value - old_value) / old_value) * 100
+    return max(0, int(np.busday_count(_to_day(start), last_day + 1)))
+
+def is_market_hours():
+    now = datetime.now()
     
-    @staticmethod
-    def clamp(value, min_value, max_value):
-        return max(min_value, min(value, max_value))
+    if now.weekday() >= 5:
+        return False
     
-    @staticmethod
-    def safe_divide(numerator, denominator, default=0):
-        try:
-            if denominator == 0:
-                return default
-            return numerator / denominator
-        except:
-            return default
+    market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
+    market_close = now.replace(hour=16, minute=0, second=0, microsecond=0)
     
-    @staticmethod
-    def get_business_days(start_date, end_date):
-        from pandas.tseries.offsets import BDay
-        import pandas as pd
-        
-        date_range = pd.date_range(start=start_date, end=end_date, freq=BDay())
-        return len(date_range)
-    
-    @staticmethod
-    def is_market_hours():
-        now = datetime.now()
-        
-        if now.weekday() >= 5:
-            return False
-        
-        market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
-        market_close = now.replace(hour=16, minute=0, second=0, microsecond=0)
-        
-        return market_open <= now <= market_close
-    
-    @staticmethod
-    def chunk_list(lst, chunk_size):
-        for i in range(0, len(lst), chunk_size):
-            yield lst[i:i + chunk_size]
-    
-    @staticmethod
-    def flatten_dict(d, parent_key='', sep='_'):
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
+    return market_open <= now <= market_close
+
+def chunk_list(lst, chunk_size):
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i:i + chunk_size]
+
+def flatten_dict(d, parent_key='', sep='_'):
+    flat = {}
+    stack = [(iter(d.items()), parent_key)]
+    
+    while stack:
+        items, prefix = stack[-1]
+        for k, v in items:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
             if isinstance(v, dict):
-                items.extend(Helpers.flatten_dict(v, new_key, sep=sep).items())
+                stack.append((iter(v.items()), new_key))
+                break
+            flat[new_key] = v
+        else:
+            stack.pop()
+    
+    return flat
+
+def sanitize_filename(filename):
+    return _WHITESPACE_RUN.sub('_', _UNSAFE_FILENAME_CHARS.sub('', filename))
+
+def get_file_size_mb(file_path):
+    try:
+        size_bytes = Path(file_path).stat().st_size
+        return size_bytes / (1024 * 1024)
+    except:
+        return 0
+
+def truncate_string(text, max_length, suffix='...'):
+    return truncate_text(text, max_length, suffix)
+
+def deep_merge_dicts(dict1, dict2):
+    result = dict1.copy()
+    pending = [(result, dict2)]
+    
+    while pending:
+        target, source = pending.pop()
+        for key, value in source.items():
+            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
+                target[key] = target[key].copy()
+                pending.append((target[key], value))
             else:
-                items.append((new_key, v))
-        return dict(items)
+                target[key] = value
     
-    @staticmethod
-    def sanitize_filename(filename):
-        filename = re.sub(r'[^\w\s\-\.]', '', filename)
-        filename = re.sub(r'[\s]+', '_', filename)
-        return filename
+    return result
+
+def retry_operation(func, max_attempts=3, delay=1, max_delay=8.0, retriable=(Exception,), deadline=None):
+    import random
+    import time
     
-    @staticmethod
-    def get_file_size_mb(file_path):
-        try:
-            size_bytes = Path(file_path).stat().st_size
-            return size_bytes / (1024 * 1024)
-        except:
-            return 0
-    
-    @staticmethod
-    def truncate_string(text, max_length, suffix='...'):
-        if len(text) <= max_length:
-            return text
-        return text[:max_length - len(suffix)] + suffix
-    
-    @staticmethod
-    def deep_merge_dicts(dict1, dict2):
-        result = dict1.copy()
-        
-        for key, value in dict2.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = Helpers.deep_merge_dicts(result[key], value)
-            else:
-                result[key] = value
-        
-        return result
-    
-    @staticmethod
-    def retry_operation(func, max_attempts=3, delay=1):
-        import time
-        
-        for attempt in range(max_attempts):
-            try:
-                return func()
-            except Exception as e:
-                if attempt == max_attempts - 1:
-                    raise e
-                time.sleep(delay)
-        
-        return None
-    
-    @staticmethod
-    def get_age_in_days(date_string):
+    start = time.monotonic()
+    
+    for attempt in range(max_attempts):
         try:
-            date = datetime.strptime(date_string, '%Y-%m-%d')
-            return (datetime.now() - date).days
-        except:
-            return 0
-    
-    @staticmethod
-    def batch_process(items, batch_size, processor_func):
-        results = []
-        
-        for batch in Helpers.chunk_list(items, batch_size):
-            batch_results = processor_func(batch)
-            results.extend(batch_results)
-        
-        return results
\ No newline at end of file
+            return func()
+        except retriable:
+            if attempt == max_attempts - 1:
+                raise
+            
+            backoff = min(max_delay, delay * (2 ** attempt)) * (0.5 + random.random())
+            if deadline is not None and time.monotonic() - start + backoff > deadline:
+                raise
+            time.sleep(backoff)
+    
+    return None
+
+def get_age_in_days(date_string):
+    try:
+        date = datetime.strptime(date_string, '%Y-%m-%d')
+        return (datetime.now() - date).days
+    except:
+        return 0
+
+def batch_process(items, batch_size, processor_func, parallel=False, max_workers=None):
+    batches = chunk_list(items, batch_size)
+    
+    if parallel:
+        # processor_func and the batches are pickled to the workers, so
+        # processor_func has to be a module-level function
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            batch_results = list(executor.map(processor_func, batches))
+    else:
+        batch_results = map(processor_func, batches)
+    
+    results = []
+    for batch_result in batch_results:
+        results.extend(batch_result)
+    
+    return results
+
+class Helpers:
+    def __init__(self):
+        self.logger = Logger(__name__)
+    
+    generate_unique_id = staticmethod(generate_unique_id)
+    generate_hash = staticmethod(generate_hash)
+    calculate_percentage_change = staticmethod(calculate_percentage_change)
+    clamp = staticmethod(clamp)
+    safe_divide = staticmethod(safe_divide)
+    get_business_days = staticmethod(get_business_days)
+    is_market_hours = staticmethod(is_market_hours)
+    chunk_list = staticmethod(chunk_list)
+    flatten_dict = staticmethod(flatten_dict)
+    sanitize_filename = staticmethod(sanitize_filename)
+    get_file_size_mb = staticmethod(get_file_size_mb)
+    truncate_string = staticmethod(truncate_string)
+    deep_merge_dicts = staticmethod(deep_merge_dicts)
+    retry_operation = staticmethod(retry_operation)
+    get_age_in_days = staticmethod(get_age_in_days)
+    batch_process = staticmethod(batch_process)
\ No newline at end of file
@@ -1,53 +1,67 @@
 # src/utils/logger.py
 
+import functools
 import logging
 from pathlib import Path
 import sys
 
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 from app.config import LOG_LEVEL, LOG_FORMAT, LOG_FILE
 
-class Logger:
-    _loggers = {}
-    
-    def __init__(self, name):
-        if name in Logger._loggers:
-            self.logger = Logger._loggers[name]
-        else:
-            self.logger = self._setup_logger(name)
-            Logger._loggers[name] = self.logger
+_log_level = getattr(logging, LOG_LEVEL.upper(), logging.INFO)
+_console_handler = None
+_file_handler_singleton = None
+_file_handler_error = None
+
+def _shared_handlers():
+    global _console_handler, _file_handler_singleton, _file_handler_error
     
-    def _setup_logger(self, name):
-        logger = logging.getLogger(name)
-        
-        log_level = getattr(logging, LOG_LEVEL.upper(), logging.INFO)
-        logger.setLevel(log_level)
-        
-        if logger.handlers:
-            return logger
-        
+    if _console_handler is None:
         formatter = logging.Formatter(LOG_FORMAT)
         
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(log_level)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        _console_handler = logging.StreamHandler(sys.stdout)
+        _console_handler.setLevel(_log_level)
+        _console_handler.setFormatter(formatter)
         
         try:
             log_dir = Path(LOG_FILE).parent
             log_dir.mkdir(parents=True, exist_ok=True)
             
-            file_handler = logging.FileHandler(LOG_FILE)
-            file_handler.setLevel(log_level)
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            _file_handler_singleton = logging.FileHandler(LOG_FILE)
+            _file_handler_singleton.setLevel(_log_level)
+            _file_handler_singleton.setFormatter(formatter)
         except Exception as e:
-            logger.warning(f"Could not create file handler: {str(e)}")
-        
+            _file_handler_error = str(e)
+    
+    return _console_handler, _file_handler_singleton
+
+@functools.lru_cache(maxsize=None)
+def get_logger(name):
+    logger = logging.getLogger(name)
+    logger.setLevel(_log_level)
+    
+    if logger.handlers:
         return logger
     
+    console_handler, file_handler = _shared_handlers()
+    logger.addHandler(console_handler)
+    
+    if file_handler is not None:
+        logger.addHandler(file_handler)
+    else:
+        logger.warning(f"Could not create file handler: {_file_handler_error}")
+    
+    return logger
+
+class Logger:
+    __slots__ = ('name',)
+    
+    def __init__(self, name):
+        self.name = name
+    
+    @property
+    def logger(self):
+        return get_logger(self.name)
+    
     def debug(self, message):
         self.logger.debug(message)
     
@@ -1,18 +1,37 @@
 # src/utils/validators.py
 
+import functools
+import math
 import re
-from datetime import datetime
+import numpy as np
 from pathlib import Path
-import sys
 
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
+from src.utils.formatters import _parse_datetime
 from src.utils.logger import Logger
 
+_TICKER_RE = re.compile(r'^[A-Z\-\.]+$')
+_TICKER_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ-.')
+_ASCII_ALNUM = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789')
+_EMAIL_LOCAL_CHARS = _ASCII_ALNUM | frozenset('._%+-')
+_EMAIL_DOMAIN_CHARS = _ASCII_ALNUM | frozenset('.-')
+_ASCII_WHITESPACE = ' \t\n\v\f\r\x1c\x1d\x1e\x1f'
+_PHONE_STRIP_RE = re.compile(r'[\s\-\(\)]')
+_PHONE_RE = re.compile(r'^\+?1?\d{10,15}$')
+_URL_RE = re.compile(r'^https?:\/\/(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b([-a-zA-Z0-9()@:%_\+.~#?&//=]*)$')
+
+@functools.lru_cache(maxsize=256)
+def _normalized_extensions(allowed_extensions):
+    return frozenset(ext.lower() if ext.startswith('.') else f'.{ext.lower()}' for ext in allowed_extensions)
+
 class Validators:
-    def __init__(self):
-        self.logger = Logger(__name__)
+    logger = Logger(__name__)
     
     @staticmethod
     def validate_ticker(ticker):
@@ -24,23 +43,53 @@ class Validators:
         if len(ticker) < 1 or len(ticker) > 10:
             return False
         
-        if not re.match(r'^[A-Z\-\.]+$', ticker):
-            return False
+        return _TICKER_CHARS.issuperset(ticker)
+    
+    @staticmethod
+    def validate_tickers(tickers):
+        tickers = list(tickers)
+        
+        if not PYARROW_AVAILABLE:
+            return np.fromiter((Validators.validate_ticker(t) for t in tickers), dtype=bool, count=len(tickers))
         
-        return True
+        strings = pa.array([t if isinstance(t, str) else None for t in tickers], type=pa.string())
+        cleaned = pc.ascii_upper(pc.utf8_trim(strings, characters=_ASCII_WHITESPACE))
+        lengths = pc.utf8_length(cleaned)
+        
+        valid = pc.and_(
+            pc.and_(pc.greater_equal(lengths, 1), pc.less_equal(lengths, 10)),
+            pc.match_substring_regex(cleaned, _TICKER_RE.pattern)
+        )
+        mask = pc.fill_null(valid, False).to_numpy(zero_copy_only=False)
+        
+        # str.strip/str.upper have Unicode rules the Arrow kernels don't
+        # replicate, so non-ASCII tickers take the scalar path
+        non_ascii = np.flatnonzero(~pc.fill_null(pc.string_is_ascii(strings), True).to_numpy(zero_copy_only=False))
+        for i in non_ascii:
+            mask[i] = Validators.validate_ticker(tickers[i])
+        
+        return mask
     
     @staticmethod
     def validate_email(email):
         if not email or not isinstance(email, str):
             return False
         
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        if email.endswith('\n'):
+            email = email[:-1]
+        
+        local, at, domain = email.partition('@')
+        if not at or not local or not _EMAIL_LOCAL_CHARS.issuperset(local):
+            return False
+        
+        host, dot, tld = domain.rpartition('.')
+        return (bool(dot) and bool(host) and _EMAIL_DOMAIN_CHARS.issuperset(host)
+                and len(tld) >= 2 and tld.isascii() and tld.isalpha())
     
     @staticmethod
     def validate_date(date_string, date_format='%Y-%m-%d'):
         try:
-            datetime.strptime(date_string, date_format)
+            _parse_datetime(date_string, date_format)
             return True
         except:
             return False
@@ -48,8 +97,8 @@ class Validators:
     @staticmethod
     def validate_date_range(start_date, end_date, date_format='%Y-%m-%d'):
         try:
-            start = datetime.strptime(start_date, date_format)
-            end = datetime.strptime(end_date, date_format)
+            start = _parse_datetime(start_date, date_format)
+            end = _parse_datetime(end_date, date_format)
             return start <= end
         except:
             return False
@@ -106,23 +155,22 @@ class Validators:
         if not phone or not isinstance(phone, str):
             return False
         
-        phone = re.sub(r'[\s\-\(\)]', '', phone)
+        phone = _PHONE_STRIP_RE.sub('', phone)
         
-        return re.match(r'^\+?1?\d{10,15}$', phone) is not None
+        return _PHONE_RE.match(phone) is not None
     
     @staticmethod
     def validate_url(url):
         if not url or not isinstance(url, str):
             return False
         
-        pattern = r'^https?:\/\/(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b([-a-zA-Z0-9()@:%_\+.~#?&//=]*)$'
-        return re.match(pattern, url) is not None
+        return _URL_RE.match(url) is not None
     
     @staticmethod
     def validate_portfolio_allocation(allocations):
         try:
-            total = sum(allocations.values())
-            return 99 <= total <= 101
+            total = math.fsum(allocations.values())
+            return bool(99 <= total <= 101)
         except:
             return False
     
@@ -137,7 +185,7 @@ class Validators:
             return False
         
         extension = Path(filename).suffix.lower()
-        return extension in [ext.lower() if ext.startswith('.') else f'.{ext.lower()}' for ext in allowed_extensions]
+        return extension in _normalized_extensions(tuple(allowed_extensions))
     
     @staticmethod
     def validate_json_structure(data, required_keys):
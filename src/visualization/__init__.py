@@ -1,13 +1,28 @@
 # src/visualization/__init__.py
 
-from .plotly_charts import PlotlyCharts
-from .candlestick_charts import CandlestickCharts
-from .technical_overlays import TechnicalOverlays
-from .comparison_plots import ComparisonPlots
-from .performance_dashboard import PerformanceDashboard
-from .portfolio_visualizer import PortfolioVisualizer
-from .heatmaps import Heatmaps
-from .forecast_visualizer import ForecastVisualizer
+import importlib
+
+_LAZY = {
+    'PlotlyCharts': 'plotly_charts',
+    'CandlestickCharts': 'candlestick_charts',
+    'TechnicalOverlays': 'technical_overlays',
+    'ComparisonPlots': 'comparison_plots',
+    'PerformanceDashboard': 'performance_dashboard',
+    'PortfolioVisualizer': 'portfolio_visualizer',
+    'Heatmaps': 'heatmaps',
+    'ForecastVisualizer': 'forecast_visualizer'
+}
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(f'.{_LAZY[name]}', __name__)
+        cls = getattr(module, name)
+        globals()[name] = cls
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
     'PlotlyCharts',
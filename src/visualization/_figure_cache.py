@@ -0,0 +1,46 @@
+# src/visualization/_figure_cache.py
+
+from collections import OrderedDict
+import functools
+import hashlib
+import threading
+
+import pandas as pd
+import plotly.graph_objects as go
+
+_MAX_FIGURES = 32
+_figures = OrderedDict()
+_lock = threading.Lock()
+
+def _frame_key(df):
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    return (df.shape, tuple(df.columns), hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest())
+
+def cached_figure(method):
+    @functools.wraps(method)
+    def wrapper(self, df, *args, **kwargs):
+        try:
+            key = (
+                type(self).__qualname__, method.__name__, self.template, self.height,
+                _frame_key(df), args, tuple(sorted(kwargs.items()))
+            )
+            hash(key)
+        except TypeError:
+            return method(self, df, *args, **kwargs)
+        
+        with _lock:
+            fig = _figures.get(key)
+            if fig is not None:
+                _figures.move_to_end(key)
+                return go.Figure(fig)
+        
+        fig = method(self, df, *args, **kwargs)
+        
+        with _lock:
+            _figures[key] = fig
+            if len(_figures) > _MAX_FIGURES:
+                _figures.popitem(last=False)
+        
+        return go.Figure(fig)
+    
+    return wrapper
\ No newline at end of file
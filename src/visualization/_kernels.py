@@ -0,0 +1,93 @@
+# src/visualization/_kernels.py
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _r2(ss_res, ss_tot):
+    if ss_tot != 0:
+        return 1 - ss_res / ss_tot
+    return 1.0 if ss_res == 0 else 0.0
+
+def _regression_metrics_numpy(y_true, y_pred):
+    residuals = np.subtract(y_true, y_pred)
+    scratch = np.abs(residuals)
+    mae = scratch.mean()
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(residuals, y_true, out=scratch)
+    np.abs(scratch, out=scratch)
+    mape = scratch.mean() * 100
+    
+    np.square(residuals, out=scratch)
+    ss_res = scratch.sum()
+    rmse = np.sqrt(scratch.mean())
+    
+    np.subtract(y_true, y_true.mean(), out=scratch)
+    np.square(scratch, out=scratch)
+    ss_tot = scratch.sum()
+    
+    return (
+        residuals,
+        residuals.mean(),
+        residuals.std(),
+        rmse,
+        mae,
+        _r2(ss_res, ss_tot),
+        mape
+    )
+
+def _regression_metrics_loop(y_true, y_pred):
+    n = y_true.size
+    residuals = np.empty(n)
+    sum_true = 0.0
+    sum_res = 0.0
+    ss_res = 0.0
+    abs_err = 0.0
+    abs_pct_err = 0.0
+    
+    for i in range(n):
+        d = y_true[i] - y_pred[i]
+        residuals[i] = d
+        sum_true += y_true[i]
+        sum_res += d
+        ss_res += d * d
+        abs_err += abs(d)
+        abs_pct_err += abs(d / y_true[i])
+    
+    mean_true = sum_true / n
+    mean_res = sum_res / n
+    ss_tot = 0.0
+    ss_dev = 0.0
+    
+    for i in range(n):
+        t = y_true[i] - mean_true
+        ss_tot += t * t
+        r = residuals[i] - mean_res
+        ss_dev += r * r
+    
+    if ss_tot != 0:
+        r2 = 1 - ss_res / ss_tot
+    elif ss_res == 0:
+        r2 = 1.0
+    else:
+        r2 = 0.0
+    
+    return (residuals, mean_res, math.sqrt(ss_dev / n), math.sqrt(ss_res / n),
+            abs_err / n, r2, abs_pct_err / n * 100)
+
+if NUMBA_AVAILABLE:
+    _regression_metrics = njit(cache=True, error_model='numpy')(_regression_metrics_loop)
+else:
+    _regression_metrics = _regression_metrics_numpy
+
+def regression_metrics(y_true, y_pred):
+    if y_true.shape != y_pred.shape or not y_true.size:
+        return _regression_metrics_numpy(y_true, y_pred)
+    return _regression_metrics(y_true, y_pred)
\ No newline at end of file
@@ -0,0 +1,34 @@
+# src/visualization/_payload.py
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+def prep(series, downcast='float'):
+    return pd.to_numeric(series, downcast=downcast).to_numpy()
+
+def columnar(df):
+    for position, dtype in enumerate(df.dtypes):
+        if isinstance(dtype, np.dtype) and not df.iloc[:, position].to_numpy().flags.c_contiguous:
+            return df.copy()
+    return df
+
+def line_traces(df, specs, x=None):
+    if x is None:
+        x = df.index.to_numpy()
+    return [
+        go.Scattergl(x=x, y=prep(df[column]), mode='lines', name=name, **style)
+        for column, name, style in specs
+        if column in df.columns
+    ]
+
+def hist_bar(values, name, color='blue', nbins=30):
+    values = np.asarray(values, dtype=np.float64).ravel()
+    counts, edges = np.histogram(values[np.isfinite(values)], bins=nbins)
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=edges[1] - edges[0],
+        name=name,
+        marker_color=color
+    )
\ No newline at end of file
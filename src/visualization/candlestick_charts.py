@@ -2,22 +2,39 @@
 
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+import numpy as np
 
 from app.config import CHART_HEIGHT, CHART_TEMPLATE
 from src.utils.logger import Logger
+from src.visualization._figure_cache import cached_figure
 
 class CandlestickCharts:
+    logger = Logger(__name__)
+    
     def __init__(self):
-        self.logger = Logger(__name__)
         self.template = CHART_TEMPLATE
         self.height = CHART_HEIGHT
     
+    @cached_figure
     def plot_candlestick(self, df, symbol="Stock", show_volume=True):
+        x = df.index
+        o = df['Open'].to_numpy()
+        h = df['High'].to_numpy()
+        l = df['Low'].to_numpy()
+        c = df['Close'].to_numpy()
+        
+        candlestick = {
+            'type': 'candlestick',
+            'x': x,
+            'open': o,
+            'high': h,
+            'low': l,
+            'close': c,
+            'name': 'OHLC',
+            'increasing': {'line': {'color': 'green'}},
+            'decreasing': {'line': {'color': 'red'}}
+        }
+        
         if show_volume:
             fig = make_subplots(
                 rows=2, cols=1,
@@ -26,37 +43,22 @@ class CandlestickCharts:
                 row_heights=[0.7, 0.3],
                 subplot_titles=(f'{symbol} Price', 'Volume')
             )
-        else:
-            fig = go.Figure()
-        
-        candlestick = go.Candlestick(
-            x=df.index,
-            open=df['Open'],
-            high=df['High'],
-            low=df['Low'],
-            close=df['Close'],
-            name='OHLC',
-            increasing_line_color='green',
-            decreasing_line_color='red'
-        )
-        
-        if show_volume:
             fig.add_trace(candlestick, row=1, col=1)
+            
+            colors = np.where(c < o, 'red', 'green').tolist()
+            
+            fig.add_trace({
+                'type': 'bar',
+                'x': x,
+                'y': df['Volume'].to_numpy(),
+                'name': 'Volume',
+                'marker': {'color': colors},
+                'showlegend': False
+            }, row=2, col=1)
         else:
+            fig = go.Figure()
             fig.add_trace(candlestick)
         
-        if show_volume:
-            colors = ['red' if df['Close'].iloc[i] < df['Open'].iloc[i] else 'green' 
-                      for i in range(len(df))]
-            
-            fig.add_trace(go.Bar(
-                x=df.index,
-                y=df['Volume'],
-                name='Volume',
-                marker_color=colors,
-                showlegend=False
-            ), row=2, col=1)
-        
         fig.update_layout(
             title=f'{symbol} - Candlestick Chart',
             xaxis_title='Date',
@@ -73,6 +75,7 @@ class CandlestickCharts:
         
         return fig
     
+    @cached_figure
     def plot_candlestick_with_indicators(self, df, symbol="Stock"):
         fig = make_subplots(
             rows=3, cols=1,
@@ -82,55 +85,63 @@ class CandlestickCharts:
             subplot_titles=(f'{symbol} Price', 'Volume', 'RSI')
         )
         
-        fig.add_trace(go.Candlestick(
-            x=df.index,
-            open=df['Open'],
-            high=df['High'],
-            low=df['Low'],
-            close=df['Close'],
-            name='OHLC',
-            increasing_line_color='green',
-            decreasing_line_color='red'
-        ), row=1, col=1)
+        x = df.index
+        o = df['Open'].to_numpy()
+        c = df['Close'].to_numpy()
+        
+        fig.add_trace({
+            'type': 'candlestick',
+            'x': x,
+            'open': o,
+            'high': df['High'].to_numpy(),
+            'low': df['Low'].to_numpy(),
+            'close': c,
+            'name': 'OHLC',
+            'increasing': {'line': {'color': 'green'}},
+            'decreasing': {'line': {'color': 'red'}}
+        }, row=1, col=1)
         
         if 'SMA_20' in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=df['SMA_20'],
-                mode='lines',
-                name='SMA 20',
-                line=dict(color='orange', width=1.5)
-            ), row=1, col=1)
+            fig.add_trace({
+                'type': 'scatter',
+                'x': x,
+                'y': df['SMA_20'].to_numpy(),
+                'mode': 'lines',
+                'name': 'SMA 20',
+                'line': {'color': 'orange', 'width': 1.5}
+            }, row=1, col=1)
         
         if 'SMA_50' in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=df['SMA_50'],
-                mode='lines',
-                name='SMA 50',
-                line=dict(color='blue', width=1.5)
-            ), row=1, col=1)
-        
-        colors = ['red' if df['Close'].iloc[i] < df['Open'].iloc[i] else 'green' 
-                  for i in range(len(df))]
-        
-        fig.add_trace(go.Bar(
-            x=df.index,
-            y=df['Volume'],
-            name='Volume',
-            marker_color=colors,
-            showlegend=False
-        ), row=2, col=1)
+            fig.add_trace({
+                'type': 'scatter',
+                'x': x,
+                'y': df['SMA_50'].to_numpy(),
+                'mode': 'lines',
+                'name': 'SMA 50',
+                'line': {'color': 'blue', 'width': 1.5}
+            }, row=1, col=1)
+        
+        colors = np.where(c < o, 'red', 'green').tolist()
+        
+        fig.add_trace({
+            'type': 'bar',
+            'x': x,
+            'y': df['Volume'].to_numpy(),
+            'name': 'Volume',
+            'marker': {'color': colors},
+            'showlegend': False
+        }, row=2, col=1)
         
         if 'RSI' in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=df['RSI'],
-                mode='lines',
-                name='RSI',
-                line=dict(color='purple', width=2),
-                showlegend=False
-            ), row=3, col=1)
+            fig.add_trace({
+                'type': 'scatter',
+                'x': x,
+                'y': df['RSI'].to_numpy(),
+                'mode': 'lines',
+                'name': 'RSI',
+                'line': {'color': 'purple', 'width': 2},
+                'showlegend': False
+            }, row=3, col=1)
             
             fig.add_hline(y=70, line_dash="dash", line_color="red", row=3, col=1)
             fig.add_hline(y=30, line_dash="dash", line_color="green", row=3, col=1)
@@ -149,15 +160,17 @@ class CandlestickCharts:
         
         return fig
     
+    @cached_figure
     def plot_ohlc(self, df, symbol="Stock"):
-        fig = go.Figure(data=go.Ohlc(
-            x=df.index,
-            open=df['Open'],
-            high=df['High'],
-            low=df['Low'],
-            close=df['Close'],
-            name='OHLC'
-        ))
+        fig = go.Figure(data={
+            'type': 'ohlc',
+            'x': df.index,
+            'open': df['Open'],
+            'high': df['High'],
+            'low': df['Low'],
+            'close': df['Close'],
+            'name': 'OHLC'
+        })
         
         fig.update_layout(
             title=f'{symbol} - OHLC Chart',
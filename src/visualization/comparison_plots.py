@@ -3,36 +3,54 @@
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.config import CHART_HEIGHT, CHART_TEMPLATE
 from src.utils.logger import Logger
 
 class ComparisonPlots:
+    logger = Logger(__name__)
+    
     def __init__(self):
-        self.logger = Logger(__name__)
         self.template = CHART_TEMPLATE
         self.height = CHART_HEIGHT
+        self._colors = ('blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray', 'cyan', 'magenta')
+        self._line_specs_w2 = tuple(dict(color=c, width=2) for c in self._colors)
+    
+    def _aligned_closes(self, stock_data_dict):
+        frames = list(stock_data_dict.values())
+        if not frames:
+            return None
+        
+        index = frames[0].index
+        if not all(df.index.equals(index) for df in frames[1:]):
+            return None
+        
+        return pd.DataFrame(
+            np.column_stack([df['Close'].to_numpy(dtype=np.float64) for df in frames]),
+            index=index
+        )
     
     def plot_normalized_prices(self, stock_data_dict):
         fig = go.Figure()
         
-        colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray', 'cyan', 'magenta']
+        line_specs = self._line_specs_w2
+        n_specs = len(line_specs)
         
+        traces = []
         for idx, (symbol, df) in enumerate(stock_data_dict.items()):
-            normalized = (df['Close'] / df['Close'].iloc[0]) * 100
+            close = df['Close'].to_numpy(dtype=np.float64)
+            normalized = ((close / close[0]) * 100).astype(np.float32)
             
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=normalized,
-                mode='lines',
-                name=symbol,
-                line=dict(color=colors[idx % len(colors)], width=2)
-            ))
+            traces.append({
+                'type': 'scatter',
+                'x': df.index,
+                'y': normalized,
+                'mode': 'lines',
+                'name': symbol,
+                'line': line_specs[idx % n_specs]
+            })
+        
+        fig.add_traces(traces)
         
         fig.update_layout(
             title='Normalized Stock Price Comparison (Base = 100)',
@@ -48,16 +66,21 @@ class ComparisonPlots:
     def plot_volume_comparison(self, stock_data_dict):
         fig = go.Figure()
         
-        colors = ['blue', 'red', 'green', 'orange', 'purple']
+        colors = self._colors[:5]
+        n_colors = len(colors)
         
+        traces = []
         for idx, (symbol, df) in enumerate(stock_data_dict.items()):
-            fig.add_trace(go.Bar(
-                x=df.index,
-                y=df['Volume'],
-                name=symbol,
-                marker_color=colors[idx % len(colors)],
-                opacity=0.7
-            ))
+            traces.append({
+                'type': 'bar',
+                'x': df.index,
+                'y': df['Volume'].to_numpy(),
+                'name': symbol,
+                'marker': {'color': colors[idx % n_colors]},
+                'opacity': 0.7
+            })
+        
+        fig.add_traces(traces)
         
         fig.update_layout(
             title='Volume Comparison',
@@ -73,20 +96,31 @@ class ComparisonPlots:
     def plot_cumulative_returns(self, stock_data_dict):
         fig = go.Figure()
         
-        colors = ['blue', 'red', 'green', 'orange', 'purple']
-        
-        for idx, (symbol, df) in enumerate(stock_data_dict.items()):
-            returns = df['Close'].pct_change()
-            cumulative_returns = (1 + returns).cumprod() - 1
-            cumulative_returns_pct = cumulative_returns * 100
-            
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=cumulative_returns_pct,
-                mode='lines',
-                name=symbol,
-                line=dict(color=colors[idx % len(colors)], width=2)
-            ))
+        line_specs = self._line_specs_w2[:5]
+        n_specs = len(line_specs)
+        
+        closes = self._aligned_closes(stock_data_dict)
+        if closes is not None:
+            cumulative_returns_pct = ((1 + closes.pct_change()).cumprod() - 1) * 100
+            curves = [(closes.index, cumulative_returns_pct[idx].to_numpy()) for idx in range(len(stock_data_dict))]
+        else:
+            curves = [
+                (df.index, ((1 + df['Close'].pct_change()).cumprod() - 1) * 100)
+                for df in stock_data_dict.values()
+            ]
+        
+        traces = []
+        for idx, (symbol, (x, y)) in enumerate(zip(stock_data_dict, curves)):
+            traces.append({
+                'type': 'scatter',
+                'x': x,
+                'y': y,
+                'mode': 'lines',
+                'name': symbol,
+                'line': line_specs[idx % n_specs]
+            })
+        
+        fig.add_traces(traces)
         
         fig.add_hline(y=0, line_dash="dash", line_color="gray")
         
@@ -104,19 +138,31 @@ class ComparisonPlots:
     def plot_volatility_comparison(self, stock_data_dict, window=20):
         fig = go.Figure()
         
-        colors = ['blue', 'red', 'green', 'orange', 'purple']
-        
-        for idx, (symbol, df) in enumerate(stock_data_dict.items()):
-            returns = df['Close'].pct_change()
-            volatility = returns.rolling(window=window).std() * np.sqrt(252) * 100
-            
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=volatility,
-                mode='lines',
-                name=symbol,
-                line=dict(color=colors[idx % len(colors)], width=2)
-            ))
+        line_specs = self._line_specs_w2[:5]
+        n_specs = len(line_specs)
+        
+        closes = self._aligned_closes(stock_data_dict)
+        if closes is not None:
+            volatility = closes.pct_change().rolling(window=window).std() * np.sqrt(252) * 100
+            curves = [(closes.index, volatility[idx].to_numpy()) for idx in range(len(stock_data_dict))]
+        else:
+            curves = [
+                (df.index, df['Close'].pct_change().rolling(window=window).std() * np.sqrt(252) * 100)
+                for df in stock_data_dict.values()
+            ]
+        
+        traces = []
+        for idx, (symbol, (x, y)) in enumerate(zip(stock_data_dict, curves)):
+            traces.append({
+                'type': 'scatter',
+                'x': x,
+                'y': y,
+                'mode': 'lines',
+                'name': symbol,
+                'line': line_specs[idx % n_specs]
+            })
+        
+        fig.add_traces(traces)
         
         fig.update_layout(
             title=f'Rolling Volatility Comparison ({window} days)',
@@ -143,13 +189,14 @@ class ComparisonPlots:
         
         fig = go.Figure()
         
-        fig.add_trace(go.Scatter(
-            x=df1.index,
-            y=ratio,
-            mode='lines',
-            name=f'{symbol1}/{symbol2}',
-            line=dict(color='blue', width=2)
-        ))
+        fig.add_trace({
+            'type': 'scatter',
+            'x': df1.index,
+            'y': ratio,
+            'mode': 'lines',
+            'name': f'{symbol1}/{symbol2}',
+            'line': {'color': 'blue', 'width': 2}
+        })
         
         mean_ratio = ratio.mean()
         fig.add_hline(y=mean_ratio, line_dash="dash", line_color="red", annotation_text=f"Mean: {mean_ratio:.2f}")
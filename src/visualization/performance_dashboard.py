@@ -1,31 +1,60 @@
 # src/visualization/performance_dashboard.py
 
+import functools
+
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 from app.config import CHART_HEIGHT, CHART_TEMPLATE
 from src.utils.logger import Logger
+from src.visualization._kernels import regression_metrics
+from src.visualization._payload import hist_bar
+
+_SUMMARY_CACHE_MAX_ELEMENTS = 100_000
+
+def _regression_summary(y_true, y_pred):
+    residuals, mean_residual, std_residual, rmse, mae, r2, mape = regression_metrics(y_true, y_pred)
+    return {
+        'residuals': residuals,
+        'mean_residual': mean_residual,
+        'std_residual': std_residual,
+        'rmse': rmse,
+        'mae': mae,
+        'r2': r2,
+        'mape': mape
+    }
+
+@functools.lru_cache(maxsize=32)
+def _cached_regression_summary(y_true_bytes, y_pred_bytes):
+    summary = _regression_summary(np.frombuffer(y_true_bytes), np.frombuffer(y_pred_bytes))
+    summary['residuals'].flags.writeable = False
+    return summary
+
+def _summarize(y_true, y_pred):
+    y_true = np.asarray(y_true, dtype=np.float64).ravel()
+    y_pred = np.asarray(y_pred, dtype=np.float64).ravel()
+    
+    if y_true.size + y_pred.size <= _SUMMARY_CACHE_MAX_ELEMENTS:
+        return _cached_regression_summary(y_true.tobytes(), y_pred.tobytes())
+    return _regression_summary(y_true, y_pred)
 
 class PerformanceDashboard:
+    logger = Logger(__name__)
+    
     def __init__(self):
-        self.logger = Logger(__name__)
         self.template = CHART_TEMPLATE
         self.height = CHART_HEIGHT
+        self._base_layout = go.Layout(template=self.template, height=self.height)
     
     def plot_prediction_vs_actual(self, y_true, y_pred, dates=None):
-        fig = go.Figure()
+        fig = go.Figure(layout=self._base_layout)
         
         if dates is None:
             dates = list(range(len(y_true)))
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=dates,
             y=y_true,
             mode='lines+markers',
@@ -34,7 +63,7 @@ class PerformanceDashboard:
             marker=dict(size=6)
         ))
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=dates,
             y=y_pred,
             mode='lines+markers',
@@ -47,22 +76,21 @@ class PerformanceDashboard:
             title='Prediction vs Actual Prices',
             xaxis_title='Date',
             yaxis_title='Price ($)',
-            template=self.template,
-            height=self.height,
             hovermode='x unified'
         )
         
         return fig
     
     def plot_residuals(self, y_true, y_pred, dates=None):
-        residuals = y_true - y_pred
+        summary = _summarize(y_true, y_pred)
+        residuals = summary['residuals']
         
         if dates is None:
             dates = list(range(len(residuals)))
         
-        fig = go.Figure()
+        fig = go.Figure(layout=self._base_layout)
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=dates,
             y=residuals,
             mode='markers',
@@ -72,8 +100,8 @@ class PerformanceDashboard:
         
         fig.add_hline(y=0, line_dash="dash", line_color="black")
         
-        mean_residual = np.mean(residuals)
-        std_residual = np.std(residuals)
+        mean_residual = summary['mean_residual']
+        std_residual = summary['std_residual']
         
         fig.add_hline(y=mean_residual + 2*std_residual, line_dash="dot", line_color="red")
         fig.add_hline(y=mean_residual - 2*std_residual, line_dash="dot", line_color="red")
@@ -81,9 +109,7 @@ class PerformanceDashboard:
         fig.update_layout(
             title='Prediction Residuals',
             xaxis_title='Date',
-            yaxis_title='Residual (Actual - Predicted)',
-            template=self.template,
-            height=self.height
+            yaxis_title='Residual (Actual - Predicted)'
         )
         
         return fig
@@ -99,26 +125,11 @@ class PerformanceDashboard:
             subplot_titles=('R² Score', 'RMSE', 'MAE')
         )
         
-        fig.add_trace(go.Bar(
-            x=models,
-            y=r2_scores,
-            name='R²',
-            marker_color='blue'
-        ), row=1, col=1)
-        
-        fig.add_trace(go.Bar(
-            x=models,
-            y=rmse_scores,
-            name='RMSE',
-            marker_color='red'
-        ), row=1, col=2)
-        
-        fig.add_trace(go.Bar(
-            x=models,
-            y=mae_scores,
-            name='MAE',
-            marker_color='green'
-        ), row=1, col=3)
+        fig.add_traces([
+            go.Bar(x=models, y=r2_scores, name='R²', marker_color='blue'),
+            go.Bar(x=models, y=rmse_scores, name='RMSE', marker_color='red'),
+            go.Bar(x=models, y=mae_scores, name='MAE', marker_color='green')
+        ], rows=[1, 1, 1], cols=[1, 2, 3])
         
         fig.update_layout(
             title='Model Performance Comparison',
@@ -134,12 +145,17 @@ class PerformanceDashboard:
         return fig
     
     def plot_accuracy_over_time(self, predictions_history):
-        dates = [p['date'] for p in predictions_history]
-        accuracies = [p['accuracy'] for p in predictions_history]
+        if not isinstance(predictions_history, pd.DataFrame):
+            predictions_history = pd.DataFrame(predictions_history, columns=['date', 'accuracy'])
+        
+        dates = predictions_history['date'].to_numpy()
+        accuracies = predictions_history['accuracy'].to_numpy(dtype=np.float64)
         
-        fig = go.Figure()
+        average = accuracies.mean()
         
-        fig.add_trace(go.Scatter(
+        fig = go.Figure(layout=self._base_layout)
+        
+        fig.add_trace(go.Scattergl(
             x=dates,
             y=accuracies,
             mode='lines+markers',
@@ -148,48 +164,38 @@ class PerformanceDashboard:
             marker=dict(size=8)
         ))
         
-        fig.add_hline(y=np.mean(accuracies), line_dash="dash", line_color="red", 
-                     annotation_text=f"Average: {np.mean(accuracies):.2f}%")
+        fig.add_hline(y=average, line_dash="dash", line_color="red", 
+                     annotation_text=f"Average: {average:.2f}%")
         
         fig.update_layout(
             title='Model Accuracy Over Time',
             xaxis_title='Date',
-            yaxis_title='Accuracy (%)',
-            template=self.template,
-            height=self.height
+            yaxis_title='Accuracy (%)'
         )
         
         return fig
     
     def plot_error_distribution(self, y_true, y_pred):
-        errors = y_true - y_pred
+        errors = _summarize(y_true, y_pred)['residuals']
         
-        fig = go.Figure()
+        fig = go.Figure(layout=self._base_layout)
         
-        fig.add_trace(go.Histogram(
-            x=errors,
-            nbinsx=30,
-            name='Error Distribution',
-            marker_color='blue'
-        ))
+        fig.add_trace(hist_bar(errors, 'Error Distribution', color='blue'))
         
         fig.update_layout(
             title='Prediction Error Distribution',
             xaxis_title='Error (Actual - Predicted)',
-            yaxis_title='Frequency',
-            template=self.template,
-            height=self.height
+            yaxis_title='Frequency'
         )
         
         return fig
     
     def create_performance_dashboard(self, y_true, y_pred, model_name="Model"):
-        from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
-        
-        rmse = np.sqrt(mean_squared_error(y_true, y_pred))
-        mae = mean_absolute_error(y_true, y_pred)
-        r2 = r2_score(y_true, y_pred)
-        mape = np.mean(np.abs((y_true - y_pred) / y_true)) * 100
+        summary = _summarize(y_true, y_pred)
+        rmse = summary['rmse']
+        mae = summary['mae']
+        r2 = summary['r2']
+        mape = summary['mape']
         
         fig = make_subplots(
             rows=2, cols=2,
@@ -203,36 +209,31 @@ class PerformanceDashboard:
                    [{'type': 'histogram'}, {'type': 'indicator'}]]
         )
         
-        fig.add_trace(go.Scatter(
-            y=y_true,
-            mode='lines',
-            name='Actual',
-            line=dict(color='blue')
-        ), row=1, col=1)
-        
-        fig.add_trace(go.Scatter(
-            y=y_pred,
-            mode='lines',
-            name='Predicted',
-            line=dict(color='red', dash='dash')
-        ), row=1, col=1)
-        
-        residuals = y_true - y_pred
-        fig.add_trace(go.Scatter(
-            y=residuals,
-            mode='markers',
-            name='Residuals',
-            marker=dict(color='purple')
-        ), row=1, col=2)
+        residuals = summary['residuals']
+        fig.add_traces([
+            go.Scattergl(
+                y=y_true,
+                mode='lines',
+                name='Actual',
+                line=dict(color='blue')
+            ),
+            go.Scattergl(
+                y=y_pred,
+                mode='lines',
+                name='Predicted',
+                line=dict(color='red', dash='dash')
+            ),
+            go.Scattergl(
+                y=residuals,
+                mode='markers',
+                name='Residuals',
+                marker=dict(color='purple')
+            ),
+            hist_bar(residuals, 'Errors', color='green')
+        ], rows=[1, 1, 1, 2], cols=[1, 1, 2, 1])
         
         fig.add_hline(y=0, line_dash="dash", line_color="black", row=1, col=2)
         
-        fig.add_trace(go.Histogram(
-            x=residuals,
-            name='Errors',
-            marker_color='green'
-        ), row=2, col=1)
-        
         metrics_text = f"R²: {r2:.4f}<br>RMSE: {rmse:.4f}<br>MAE: {mae:.4f}<br>MAPE: {mape:.2f}%"
         
         fig.add_annotation(
@@ -1,27 +1,49 @@
 # src/visualization/plotly_charts.py
 
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import plotly.express as px
 import pandas as pd
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+import numpy as np
 
 from app.config import CHART_HEIGHT, CHART_TEMPLATE, PRIMARY_COLOR, SECONDARY_COLOR
 from src.utils.logger import Logger
+from src.visualization._figure_cache import cached_figure
+from src.visualization._payload import columnar, line_traces, prep
+
+_DOWN_UP_COLORSCALE = [[0, 'red'], [1, 'green']]
+
+_MOVING_AVERAGE_LINES = (
+    ('Close', 'Close Price', {'line': {'color': 'blue', 'width': 2}}),
+    ('SMA_20', 'SMA 20', {'line': {'color': 'orange', 'width': 1.5}}),
+    ('SMA_50', 'SMA 50', {'line': {'color': 'red', 'width': 1.5}}),
+    ('EMA_12', 'EMA 12', {'line': {'color': 'green', 'width': 1, 'dash': 'dash'}})
+)
+_PRICE_LINES = (
+    ('Close', 'Close', {'line': {'color': 'blue', 'width': 2}}),
+    ('SMA_20', 'SMA 20', {'line': {'color': 'orange', 'width': 1}})
+)
+_RSI_LINES = (
+    ('RSI', 'RSI', {'line': {'color': 'purple', 'width': 2}}),
+)
+_MACD_LINES = (
+    ('MACD', 'MACD', {'line': {'color': 'blue', 'width': 2}}),
+    ('MACD_Signal', 'Signal', {'line': {'color': 'red', 'width': 2}})
+)
 
 class PlotlyCharts:
+    logger = Logger(__name__)
+    
     def __init__(self):
-        self.logger = Logger(__name__)
         self.template = CHART_TEMPLATE
         self.height = CHART_HEIGHT
+        self._base_layout = go.Layout(template=self.template, height=self.height)
     
+    @cached_figure
     def plot_line_chart(self, df, x_col, y_col, title="Stock Price", color=PRIMARY_COLOR):
-        fig = go.Figure()
+        fig = go.Figure(layout=self._base_layout)
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=df[x_col],
             y=df[y_col],
             mode='lines',
@@ -34,18 +56,17 @@ class PlotlyCharts:
             title=title,
             xaxis_title=x_col,
             yaxis_title=y_col,
-            template=self.template,
-            height=self.height,
             hovermode='x unified',
             showlegend=True
         )
         
         return fig
     
+    @cached_figure
     def plot_area_chart(self, df, x_col, y_col, title="Stock Price Area"):
-        fig = go.Figure()
+        fig = go.Figure(layout=self._base_layout)
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=df[x_col],
             y=df[y_col],
             mode='lines',
@@ -59,15 +80,14 @@ class PlotlyCharts:
             title=title,
             xaxis_title=x_col,
             yaxis_title=y_col,
-            template=self.template,
-            height=self.height,
             hovermode='x unified'
         )
         
         return fig
     
+    @cached_figure
     def plot_bar_chart(self, df, x_col, y_col, title="Bar Chart"):
-        fig = go.Figure()
+        fig = go.Figure(layout=self._base_layout)
         
         fig.add_trace(go.Bar(
             x=df[x_col],
@@ -79,68 +99,35 @@ class PlotlyCharts:
         fig.update_layout(
             title=title,
             xaxis_title=x_col,
-            yaxis_title=y_col,
-            template=self.template,
-            height=self.height
+            yaxis_title=y_col
         )
         
         return fig
     
+    @cached_figure
     def plot_moving_averages(self, df, symbol="Stock"):
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=df.index,
-            y=df['Close'],
-            mode='lines',
-            name='Close Price',
-            line=dict(color='blue', width=2)
-        ))
+        df = columnar(df)
         
-        if 'SMA_20' in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=df['SMA_20'],
-                mode='lines',
-                name='SMA 20',
-                line=dict(color='orange', width=1.5)
-            ))
-        
-        if 'SMA_50' in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=df['SMA_50'],
-                mode='lines',
-                name='SMA 50',
-                line=dict(color='red', width=1.5)
-            ))
+        fig = go.Figure(layout=self._base_layout)
         
-        if 'EMA_12' in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=df['EMA_12'],
-                mode='lines',
-                name='EMA 12',
-                line=dict(color='green', width=1, dash='dash')
-            ))
+        fig.add_traces(line_traces(df, _MOVING_AVERAGE_LINES))
         
         fig.update_layout(
             title=f"{symbol} - Price with Moving Averages",
             xaxis_title="Date",
             yaxis_title="Price ($)",
-            template=self.template,
-            height=self.height,
             hovermode='x unified'
         )
         
         return fig
     
+    @cached_figure
     def plot_rsi(self, df, symbol="Stock"):
-        fig = go.Figure()
+        fig = go.Figure(layout=self._base_layout)
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=df.index,
-            y=df['RSI'],
+            y=prep(df['RSI']),
             mode='lines',
             name='RSI',
             line=dict(color='purple', width=2)
@@ -154,39 +141,38 @@ class PlotlyCharts:
             title=f"{symbol} - RSI Indicator",
             xaxis_title="Date",
             yaxis_title="RSI",
-            template=self.template,
-            height=self.height,
             yaxis=dict(range=[0, 100]),
             hovermode='x unified'
         )
         
         return fig
     
+    @cached_figure
     def plot_macd(self, df, symbol="Stock"):
-        fig = go.Figure()
+        fig = go.Figure(layout=self._base_layout)
         
-        fig.add_trace(go.Scatter(
-            x=df.index,
-            y=df['MACD'],
-            mode='lines',
-            name='MACD',
-            line=dict(color='blue', width=2)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=df.index,
-            y=df['MACD_Signal'],
-            mode='lines',
-            name='Signal',
-            line=dict(color='red', width=2)
-        ))
-        
-        fig.add_trace(go.Bar(
-            x=df.index,
-            y=df['MACD_Histogram'],
-            name='Histogram',
-            marker_color='gray'
-        ))
+        fig.add_traces([
+            go.Scattergl(
+                x=df.index,
+                y=prep(df['MACD']),
+                mode='lines',
+                name='MACD',
+                line=dict(color='blue', width=2)
+            ),
+            go.Scattergl(
+                x=df.index,
+                y=prep(df['MACD_Signal']),
+                mode='lines',
+                name='Signal',
+                line=dict(color='red', width=2)
+            ),
+            go.Bar(
+                x=df.index,
+                y=prep(df['MACD_Histogram']),
+                name='Histogram',
+                marker_color='gray'
+            )
+        ])
         
         fig.add_hline(y=0, line_dash="dash", line_color="black")
         
@@ -194,38 +180,35 @@ class PlotlyCharts:
             title=f"{symbol} - MACD Indicator",
             xaxis_title="Date",
             yaxis_title="MACD",
-            template=self.template,
-            height=self.height,
             hovermode='x unified'
         )
         
         return fig
     
+    @cached_figure
     def plot_volume(self, df, symbol="Stock"):
-        colors = ['red' if df['Close'].iloc[i] < df['Open'].iloc[i] else 'green' 
-                  for i in range(len(df))]
+        up_bars = (~(df['Close'].to_numpy() < df['Open'].to_numpy())).astype(np.int8)
         
-        fig = go.Figure()
+        fig = go.Figure(layout=self._base_layout)
         
         fig.add_trace(go.Bar(
             x=df.index,
-            y=df['Volume'],
+            y=prep(df['Volume'], downcast='integer'),
             name='Volume',
-            marker_color=colors
+            marker=dict(color=up_bars, colorscale=_DOWN_UP_COLORSCALE, cmin=0, cmax=1)
         ))
         
         fig.update_layout(
             title=f"{symbol} - Trading Volume",
             xaxis_title="Date",
-            yaxis_title="Volume",
-            template=self.template,
-            height=self.height
+            yaxis_title="Volume"
         )
         
         return fig
     
+    @cached_figure
     def plot_technical_analysis(self, df, symbol="Stock"):
-        from plotly.subplots import make_subplots
+        df = columnar(df)
         
         fig = make_subplots(
             rows=3, cols=1,
@@ -235,42 +218,21 @@ class PlotlyCharts:
             subplot_titles=(f'{symbol} Price', 'RSI', 'MACD')
         )
         
-        fig.add_trace(go.Scatter(
-            x=df.index, y=df['Close'],
-            mode='lines', name='Close',
-            line=dict(color='blue', width=2)
-        ), row=1, col=1)
-        
-        if 'SMA_20' in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df.index, y=df['SMA_20'],
-                mode='lines', name='SMA 20',
-                line=dict(color='orange', width=1)
-            ), row=1, col=1)
-        
-        if 'RSI' in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df.index, y=df['RSI'],
-                mode='lines', name='RSI',
-                line=dict(color='purple', width=2)
-            ), row=2, col=1)
-            
+        x = df.index.to_numpy()
+        price_traces = line_traces(df, _PRICE_LINES, x)
+        rsi_traces = line_traces(df, _RSI_LINES, x)
+        macd_traces = line_traces(df, _MACD_LINES, x) if 'MACD' in df.columns else []
+        
+        fig.add_traces(
+            price_traces + rsi_traces + macd_traces,
+            rows=[1] * len(price_traces) + [2] * len(rsi_traces) + [3] * len(macd_traces),
+            cols=1
+        )
+        
+        if rsi_traces:
             fig.add_hline(y=70, line_dash="dash", line_color="red", row=2, col=1)
             fig.add_hline(y=30, line_dash="dash", line_color="green", row=2, col=1)
         
-        if 'MACD' in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df.index, y=df['MACD'],
-                mode='lines', name='MACD',
-                line=dict(color='blue', width=2)
-            ), row=3, col=1)
-            
-            fig.add_trace(go.Scatter(
-                x=df.index, y=df['MACD_Signal'],
-                mode='lines', name='Signal',
-                line=dict(color='red', width=2)
-            ), row=3, col=1)
-        
         fig.update_layout(
             height=900,
             template=self.template,
@@ -3,34 +3,31 @@
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+import numpy as np
 
 from app.config import CHART_HEIGHT, CHART_TEMPLATE
 from src.utils.logger import Logger
+from src.visualization._payload import hist_bar, prep
 
 class PortfolioVisualizer:
+    logger = Logger(__name__)
+    
     def __init__(self):
-        self.logger = Logger(__name__)
         self.template = CHART_TEMPLATE
         self.height = CHART_HEIGHT
+        self._base_layout = go.Layout(template=self.template, height=self.height)
     
     def plot_allocation_pie(self, allocation_df):
         fig = go.Figure(data=[go.Pie(
-            labels=allocation_df['Symbol'],
-            values=allocation_df['Value'],
+            labels=allocation_df['Symbol'].to_numpy(),
+            values=prep(allocation_df['Value']),
             hole=0.4,
             textinfo='label+percent',
             hovertemplate='<b>%{label}</b><br>Value: $%{value:,.2f}<br>Percentage: %{percent}<extra></extra>'
-        )])
+        )], layout=self._base_layout)
         
         fig.update_layout(
             title='Portfolio Allocation',
-            template=self.template,
-            height=self.height,
             showlegend=True
         )
         
@@ -38,15 +35,13 @@ class PortfolioVisualizer:
     
     def plot_sector_allocation(self, sector_data):
         fig = go.Figure(data=[go.Pie(
-            labels=list(sector_data.keys()),
-            values=list(sector_data.values()),
+            labels=np.asarray(list(sector_data.keys()), dtype=object),
+            values=np.fromiter(sector_data.values(), dtype=np.float64, count=len(sector_data)),
             hole=0.3
-        )])
+        )], layout=self._base_layout)
         
         fig.update_layout(
-            title='Sector Allocation',
-            template=self.template,
-            height=self.height
+            title='Sector Allocation'
         )
         
         return fig
@@ -54,14 +49,14 @@ class PortfolioVisualizer:
     def plot_portfolio_performance(self, portfolio_history):
         if isinstance(portfolio_history, dict):
             dates = list(portfolio_history.keys())
-            values = list(portfolio_history.values())
+            values = np.fromiter(portfolio_history.values(), dtype=np.float64, count=len(portfolio_history))
         else:
-            dates = portfolio_history['Date']
-            values = portfolio_history['Value']
+            dates = portfolio_history['Date'].to_numpy()
+            values = prep(portfolio_history['Value'])
         
-        fig = go.Figure()
+        fig = go.Figure(layout=self._base_layout)
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=dates,
             y=values,
             mode='lines',
@@ -75,87 +70,77 @@ class PortfolioVisualizer:
             title='Portfolio Value Over Time',
             xaxis_title='Date',
             yaxis_title='Portfolio Value ($)',
-            template=self.template,
-            height=self.height,
             hovermode='x unified'
         )
         
         return fig
     
     def plot_holdings_comparison(self, holdings_df):
+        values = prep(holdings_df['Value'])
+        
         fig = go.Figure(data=[
             go.Bar(
-                x=holdings_df['Symbol'],
-                y=holdings_df['Value'],
-                text=holdings_df['Value'],
+                x=holdings_df['Symbol'].to_numpy(),
+                y=values,
+                text=values,
                 texttemplate='$%{text:,.0f}',
                 textposition='outside',
                 marker_color='blue'
             )
-        ])
+        ], layout=self._base_layout)
         
         fig.update_layout(
             title='Holdings Value Comparison',
             xaxis_title='Stock Symbol',
-            yaxis_title='Value ($)',
-            template=self.template,
-            height=self.height
+            yaxis_title='Value ($)'
         )
         
         return fig
     
     def plot_gains_losses(self, holdings_df):
-        colors = ['green' if x > 0 else 'red' for x in holdings_df['Gain/Loss']]
+        gains = prep(holdings_df['Gain/Loss'])
+        colors = np.where(gains > 0, 'green', 'red')
         
         fig = go.Figure(data=[
             go.Bar(
-                x=holdings_df['Symbol'],
-                y=holdings_df['Gain/Loss'],
+                x=holdings_df['Symbol'].to_numpy(),
+                y=gains,
                 marker_color=colors,
-                text=holdings_df['Gain/Loss'],
+                text=gains,
                 texttemplate='$%{text:,.2f}',
                 textposition='outside'
             )
-        ])
+        ], layout=self._base_layout)
         
         fig.add_hline(y=0, line_dash="dash", line_color="black")
         
         fig.update_layout(
             title='Gains/Losses by Position',
             xaxis_title='Stock Symbol',
-            yaxis_title='Gain/Loss ($)',
-            template=self.template,
-            height=self.height
+            yaxis_title='Gain/Loss ($)'
         )
         
         return fig
     
     def plot_diversification_chart(self, allocation_df):
         fig = go.Figure(data=[go.Treemap(
-            labels=allocation_df['Symbol'],
+            labels=allocation_df['Symbol'].to_numpy(),
             parents=['Portfolio'] * len(allocation_df),
-            values=allocation_df['Value'],
+            values=prep(allocation_df['Value']),
             textinfo='label+value+percent parent',
             marker=dict(colorscale='Blues')
-        )])
+        )], layout=self._base_layout)
         
         fig.update_layout(
-            title='Portfolio Diversification (Treemap)',
-            template=self.template,
-            height=self.height
+            title='Portfolio Diversification (Treemap)'
         )
         
         return fig
     
     def plot_returns_distribution(self, returns):
-        fig = go.Figure()
+        fig = go.Figure(layout=self._base_layout)
         
-        fig.add_trace(go.Histogram(
-            x=returns,
-            nbinsx=30,
-            name='Returns',
-            marker_color='blue'
-        ))
+        fig.add_trace(hist_bar(returns, 'Returns', color='blue'))
         
         fig.add_vline(x=returns.mean(), line_dash="dash", line_color="red", 
                      annotation_text=f"Mean: {returns.mean():.2f}%")
@@ -163,9 +148,7 @@ class PortfolioVisualizer:
         fig.update_layout(
             title='Portfolio Returns Distribution',
             xaxis_title='Return (%)',
-            yaxis_title='Frequency',
-            template=self.template,
-            height=self.height
+            yaxis_title='Frequency'
         )
         
         return fig
\ No newline at end of file
@@ -1,76 +1,77 @@
 # src/visualization/technical_overlays.py
 
 import plotly.graph_objects as go
-from pathlib import Path
-import sys
-
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+from plotly.subplots import make_subplots
+import numpy as np
 
 from app.config import CHART_HEIGHT, CHART_TEMPLATE
 from src.utils.logger import Logger
+from src.visualization._figure_cache import cached_figure
+from src.visualization._payload import columnar, line_traces, prep
+
+_FIB_RATIOS = np.array([0.0, 0.236, 0.382, 0.5, 0.618, 1.0])
+_FIB_LABELS = ('0% (High)', '23.6%', '38.2%', '50%', '61.8%', '100% (Low)')
+_FIB_COLORS = ('red', 'orange', 'yellow', 'lightgreen', 'green', 'darkgreen')
+
+_BOLLINGER_LINES = (
+    ('Close', 'Close Price', {'line': {'color': 'blue', 'width': 2}}),
+    ('BB_Upper', 'Upper Band', {'line': {'color': 'red', 'width': 1, 'dash': 'dash'}}),
+    ('BB_Middle', 'Middle Band (SMA 20)', {'line': {'color': 'orange', 'width': 1}}),
+    ('BB_Lower', 'Lower Band', {
+        'line': {'color': 'green', 'width': 1, 'dash': 'dash'},
+        'fill': 'tonexty',
+        'fillcolor': 'rgba(128, 128, 128, 0.2)'
+    })
+)
+
+def _level_shape(y, color):
+    return {
+        'type': 'line',
+        'xref': 'x domain', 'x0': 0, 'x1': 1,
+        'yref': 'y', 'y0': y, 'y1': y,
+        'line': {'color': color, 'dash': 'dash'}
+    }
+
+def _level_annotation(y, text, position):
+    return {
+        'text': text,
+        'showarrow': False,
+        'xref': 'x domain', 'x': 0 if position == 'left' else 1,
+        'xanchor': 'right' if position == 'left' else 'left',
+        'yref': 'y', 'y': y,
+        'yanchor': 'middle'
+    }
 
 class TechnicalOverlays:
+    logger = Logger(__name__)
+    
     def __init__(self):
-        self.logger = Logger(__name__)
         self.template = CHART_TEMPLATE
         self.height = CHART_HEIGHT
+        self._base_layout = go.Layout(template=self.template, height=self.height)
     
+    @cached_figure
     def plot_bollinger_bands(self, df, symbol="Stock"):
-        fig = go.Figure()
+        df = columnar(df)
         
-        fig.add_trace(go.Scatter(
-            x=df.index,
-            y=df['Close'],
-            mode='lines',
-            name='Close Price',
-            line=dict(color='blue', width=2)
-        ))
+        fig = go.Figure(layout=self._base_layout)
         
-        if 'BB_Upper' in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=df['BB_Upper'],
-                mode='lines',
-                name='Upper Band',
-                line=dict(color='red', width=1, dash='dash')
-            ))
-        
-        if 'BB_Middle' in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=df['BB_Middle'],
-                mode='lines',
-                name='Middle Band (SMA 20)',
-                line=dict(color='orange', width=1)
-            ))
-        
-        if 'BB_Lower' in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df.index,
-                y=df['BB_Lower'],
-                mode='lines',
-                name='Lower Band',
-                line=dict(color='green', width=1, dash='dash'),
-                fill='tonexty',
-                fillcolor='rgba(128, 128, 128, 0.2)'
-            ))
+        fig.add_traces(line_traces(df, _BOLLINGER_LINES))
         
         fig.update_layout(
             title=f'{symbol} - Bollinger Bands',
             xaxis_title='Date',
             yaxis_title='Price ($)',
-            template=self.template,
-            height=self.height,
             hovermode='x unified'
         )
         
         return fig
     
+    @cached_figure
     def plot_support_resistance(self, df, symbol="Stock", levels=None):
-        fig = go.Figure()
+        fig = go.Figure(layout=self._base_layout)
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=df.index,
             y=df['Close'],
             mode='lines',
@@ -79,82 +80,67 @@ class TechnicalOverlays:
         ))
         
         if levels is None:
-            recent_high = df['High'].tail(50).max()
-            recent_low = df['Low'].tail(50).min()
+            recent_high = np.fmax.reduce(df['High'].to_numpy(dtype=np.float64)[-50:], initial=np.nan)
+            recent_low = np.fmin.reduce(df['Low'].to_numpy(dtype=np.float64)[-50:], initial=np.nan)
             levels = {
                 'Resistance': recent_high,
                 'Support': recent_low
             }
         
-        for level_name, level_value in levels.items():
-            color = 'red' if 'Resistance' in level_name else 'green'
-            fig.add_hline(
-                y=level_value,
-                line_dash="dash",
-                line_color=color,
-                annotation_text=f"{level_name}: ${level_value:.2f}",
-                annotation_position="right"
-            )
+        shapes = [
+            _level_shape(level_value, 'red' if 'Resistance' in level_name else 'green')
+            for level_name, level_value in levels.items()
+        ]
+        annotations = [
+            _level_annotation(level_value, f"{level_name}: ${level_value:.2f}", 'right')
+            for level_name, level_value in levels.items()
+        ]
         
         fig.update_layout(
+            shapes=shapes,
+            annotations=annotations,
             title=f'{symbol} - Support & Resistance Levels',
             xaxis_title='Date',
             yaxis_title='Price ($)',
-            template=self.template,
-            height=self.height,
             hovermode='x unified'
         )
         
         return fig
     
+    @cached_figure
     def plot_fibonacci_retracement(self, df, symbol="Stock"):
-        fig = go.Figure()
+        fig = go.Figure(layout=self._base_layout)
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=df.index,
-            y=df['Close'],
+            y=prep(df['Close']),
             mode='lines',
             name='Close Price',
             line=dict(color='blue', width=2)
         ))
         
-        price_max = df['High'].max()
-        price_min = df['Low'].min()
-        diff = price_max - price_min
-        
-        fib_levels = {
-            '0% (High)': price_max,
-            '23.6%': price_max - 0.236 * diff,
-            '38.2%': price_max - 0.382 * diff,
-            '50%': price_max - 0.5 * diff,
-            '61.8%': price_max - 0.618 * diff,
-            '100% (Low)': price_min
-        }
-        
-        colors = ['red', 'orange', 'yellow', 'lightgreen', 'green', 'darkgreen']
-        
-        for i, (level_name, level_value) in enumerate(fib_levels.items()):
-            fig.add_hline(
-                y=level_value,
-                line_dash="dash",
-                line_color=colors[i],
-                annotation_text=f"{level_name}: ${level_value:.2f}",
-                annotation_position="left"
-            )
+        price_max = np.fmax.reduce(df['High'].to_numpy(dtype=np.float64), initial=np.nan)
+        price_min = np.fmin.reduce(df['Low'].to_numpy(dtype=np.float64), initial=np.nan)
+        fib_levels = price_max - _FIB_RATIOS * (price_max - price_min)
+        fib_levels[-1] = price_min
         
         fig.update_layout(
+            shapes=[_level_shape(level, color) for level, color in zip(fib_levels, _FIB_COLORS)],
+            annotations=[
+                _level_annotation(level, f"{label}: ${level:.2f}", 'left')
+                for level, label in zip(fib_levels, _FIB_LABELS)
+            ],
             title=f'{symbol} - Fibonacci Retracement',
             xaxis_title='Date',
             yaxis_title='Price ($)',
-            template=self.template,
-            height=self.height,
             hovermode='x unified'
         )
         
         return fig
     
+    @cached_figure
     def plot_volume_profile(self, df, symbol="Stock"):
-        from plotly.subplots import make_subplots
+        df = columnar(df)
         
         fig = make_subplots(
             rows=1, cols=2,
@@ -165,28 +151,28 @@ class TechnicalOverlays:
         
         fig.add_trace(go.Candlestick(
             x=df.index,
-            open=df['Open'],
-            high=df['High'],
-            low=df['Low'],
-            close=df['Close'],
+            open=prep(df['Open']),
+            high=prep(df['High']),
+            low=prep(df['Low']),
+            close=prep(df['Close']),
             name='OHLC'
         ), row=1, col=1)
         
         price_bins = 50
-        price_min = df['Low'].min()
-        price_max = df['High'].max()
+        price_min = np.fmin.reduce(df['Low'].to_numpy(dtype=np.float64), initial=np.nan)
+        price_max = np.fmax.reduce(df['High'].to_numpy(dtype=np.float64), initial=np.nan)
         price_range = price_max - price_min
         bin_size = price_range / price_bins
         
-        volume_at_price = {}
-        for i in range(len(df)):
-            price = df['Close'].iloc[i]
-            volume = df['Volume'].iloc[i]
-            bin_idx = int((price - price_min) / bin_size)
-            volume_at_price[bin_idx] = volume_at_price.get(bin_idx, 0) + volume
+        close = df['Close'].to_numpy(dtype=np.float64)
+        volume = df['Volume'].to_numpy(dtype=np.float64)
+        
+        bin_pos = (close - price_min) / bin_size
+        in_range = (bin_pos >= 0) & (bin_pos < price_bins)
+        bin_idx = bin_pos[in_range].astype(np.int64)
         
-        prices = [price_min + (i + 0.5) * bin_size for i in range(price_bins)]
-        volumes = [volume_at_price.get(i, 0) for i in range(price_bins)]
+        prices = price_min + (np.arange(price_bins) + 0.5) * bin_size
+        volumes = np.bincount(bin_idx, weights=volume[in_range], minlength=price_bins)
         
         fig.add_trace(go.Bar(
             x=volumes,
@@ -0,0 +1,18 @@
+# tests/_fixtures.py
+
+from types import MappingProxyType
+
+SAMPLE_PORTFOLIO = (
+    MappingProxyType({
+        'symbol': 'AAPL',
+        'shares': 10,
+        'purchase_price': 150.00,
+        'purchase_date': '2024-01-01'
+    }),
+    MappingProxyType({
+        'symbol': 'GOOGL',
+        'shares': 5,
+        'purchase_price': 140.00,
+        'purchase_date': '2024-01-15'
+    })
+)
\ No newline at end of file
@@ -0,0 +1,144 @@
+# tests/conftest.py
+
+import functools
+import os
+import socket
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import yfinance as yf
+
+from src.data.data_loader import DataLoader
+from src.data.technical_indicators import TechnicalIndicators
+
+MARKET_CACHE_DIR = Path(__file__).parent / ".cache"
+NETWORK_PROBE = ("query2.finance.yahoo.com", 443)
+OHLCV_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
+    )
+    config.addinivalue_line(
+        "markers", "integration: marks tests as integration tests"
+    )
+    config.addinivalue_line(
+        "markers", "unit: marks tests as unit tests"
+    )
+    config.addinivalue_line(
+        "markers", "network: needs live access to Yahoo Finance (skipped when unreachable)"
+    )
+
+def _network_available():
+    try:
+        socket.create_connection(NETWORK_PROBE, timeout=3).close()
+        return True
+    except OSError:
+        return False
+
+def pytest_collection_modifyitems(config, items):
+    network_items = [item for item in items if item.get_closest_marker("network")]
+    if not network_items or _network_available():
+        return
+    
+    skip_offline = pytest.mark.skip(reason=f"{NETWORK_PROBE[0]} is unreachable")
+    for item in network_items:
+        item.add_marker(skip_offline)
+
+_PERIOD_ROWS = {'5d': 5, '1mo': 21, '3mo': 63, '6mo': 126, '1y': 252, '2y': 504, '5y': 1260}
+
+def fake_yf_history(period='1mo'):
+    n = _PERIOD_ROWS.get(period, 252)
+    rng = np.random.default_rng(n)
+    
+    close = 150 + np.cumsum(rng.normal(0, 2, n))
+    open_ = close + rng.normal(0, 1, n)
+    
+    return pd.DataFrame({
+        'Open': open_,
+        'High': np.maximum(open_, close) + rng.random(n),
+        'Low': np.minimum(open_, close) - rng.random(n),
+        'Close': close,
+        'Volume': rng.integers(50_000_000, 100_000_000, n),
+        'Dividends': 0.0,
+        'Stock Splits': 0.0
+    }, index=pd.bdate_range(end='2024-06-28', periods=n, tz='America/New_York', name='Date'))
+
+def _fake_history(ticker, period='1mo', interval='1d', **kwargs):
+    return fake_yf_history(period)
+
+@functools.lru_cache(maxsize=None)
+def _read_frame(path):
+    return pd.read_pickle(path)
+
+def _write_frame(df, path):
+    path.parent.mkdir(exist_ok=True)
+    partial = path.with_suffix(f".{os.getpid()}.tmp")
+    df.to_pickle(partial)
+    partial.replace(path)
+
+@pytest.fixture
+def live_market_data(monkeypatch):
+    live_history = yf.Ticker.history
+    
+    def history(ticker, period="1mo", interval="1d", **kwargs):
+        path = MARKET_CACHE_DIR / f"{ticker.ticker}_{period}_{interval}.pkl"
+        if path.exists():
+            return _read_frame(path).copy()
+        
+        df = live_history(ticker, period=period, interval=interval, **kwargs)
+        if not df.empty:
+            _write_frame(df, path)
+        return df
+    
+    monkeypatch.setattr(yf.Ticker, "history", history)
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_log_file(tmp_path_factory):
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr("src.utils.logger.LOG_FILE", tmp_path_factory.mktemp("logs") / "app.log")
+        yield
+
+@pytest.fixture(autouse=True)
+def isolated_data_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.data.data_cache.CACHE_DIR", tmp_path / "cache")
+
+@pytest.fixture(autouse=True)
+def offline_market_data(request, monkeypatch):
+    if request.node.get_closest_marker("integration") is None:
+        monkeypatch.setattr(yf.Ticker, "history", _fake_history)
+
+@pytest.fixture(scope="session")
+def session_loader(tmp_path_factory):
+    loader = DataLoader()
+    loader.cache.cache_dir = tmp_path_factory.mktemp("market_cache")
+    return loader
+
+def _load_aapl(loader, period, columns=OHLCV_COLUMNS):
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(yf.Ticker, "history", _fake_history)
+        df = loader.load_stock_data('AAPL', period=period, use_cache=True)
+    
+    if df is None:
+        return None
+    return df[list(columns)]
+
+@pytest.fixture(scope="session")
+def aapl_1y(session_loader):
+    return _load_aapl(session_loader, '1y')
+
+@pytest.fixture(scope="session")
+def aapl_6mo(session_loader):
+    return _load_aapl(session_loader, '6mo')
+
+@pytest.fixture(scope="session")
+def aapl_3mo(session_loader):
+    return _load_aapl(session_loader, '3mo')
+
+@pytest.fixture(scope="session")
+def aapl_with_indicators(aapl_6mo):
+    if aapl_6mo is None:
+        return None
+    return TechnicalIndicators().add_all_indicators(aapl_6mo)
\ No newline at end of file
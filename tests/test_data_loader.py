@@ -2,13 +2,8 @@
 
 import pytest
 import pandas as pd
-import sys
-from pathlib import Path
 from datetime import datetime
 
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
 from src.data.data_loader import DataLoader
 from src.data.data_validator import DataValidator
 
@@ -39,7 +34,9 @@ class TestDataLoader:
         assert 'Low' in df.columns
         assert 'Volume' in df.columns
     
-    def test_load_stock_data_invalid_symbol(self, data_loader):
+    @pytest.mark.integration
+    @pytest.mark.network
+    def test_load_stock_data_invalid_symbol(self, data_loader, live_market_data):
         df = data_loader.load_stock_data('INVALID_SYMBOL_XYZ', period='1mo', use_cache=False)
         
         assert df is None or df.empty
@@ -50,6 +47,8 @@ class TestDataLoader:
         
         assert len(df_1mo) < len(df_6mo)
     
+    @pytest.mark.integration
+    @pytest.mark.network
     def test_get_stock_info(self, data_loader):
         info = data_loader.get_stock_info('AAPL')
         
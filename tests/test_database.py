@@ -2,26 +2,32 @@
 
 import pytest
 import sqlite3
-import sys
-from pathlib import Path
-import tempfile
-
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.database.db_manager import DBManager
 
 @pytest.fixture
 def temp_db():
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
-    temp_file.close()
-    yield temp_file.name
-    
-    Path(temp_file.name).unlink(missing_ok=True)
+    return ":memory:"
 
 @pytest.fixture
 def db_manager(temp_db):
-    return DBManager(temp_db)
+    manager = DBManager(temp_db)
+    yield manager
+    manager.disconnect()
+
+@pytest.fixture
+def populated_db(db_manager):
+    with db_manager.transaction():
+        db_manager.execute_query(
+            "INSERT INTO users (username, email) VALUES (?, ?)",
+            ('tester', 'tester@example.com')
+        )
+        for symbol, shares, price in [('AAPL', 10, 150.0), ('MSFT', 5, 300.0), ('GOOGL', 8, 140.0)]:
+            db_manager.execute_query(
+                "INSERT INTO portfolios (user_id, symbol, shares, purchase_price, purchase_date) VALUES (1, ?, ?, ?, '2024-01-01')",
+                (symbol, shares, price)
+            )
+    return db_manager
 
 class TestDatabaseManager:
     
@@ -93,4 +99,29 @@ class TestDatabaseManager:
         db_manager.insert_portfolio(test_data)
         result = db_manager.delete_portfolio('AAPL')
         
-        assert result is True
\ No newline at end of file
+        assert result is True
+    
+    def test_transaction_commits_batch(self, populated_db):
+        rows = populated_db.fetch_all("SELECT symbol FROM portfolios ORDER BY portfolio_id")
+        
+        assert [row['symbol'] for row in rows] == ['AAPL', 'MSFT', 'GOOGL']
+    
+    def test_transaction_rolls_back_on_error(self, populated_db):
+        with pytest.raises(RuntimeError):
+            with populated_db.transaction():
+                populated_db.execute_query("DELETE FROM portfolios")
+                raise RuntimeError("abort")
+        
+        assert len(populated_db.fetch_all("SELECT * FROM portfolios")) == 3
+    
+    def test_transaction_rolls_back_failed_statement(self, populated_db):
+        insert = "INSERT INTO portfolios (user_id, symbol, shares, purchase_price, purchase_date) VALUES (1, ?, 1, 1.0, '2024-01-01')"
+        
+        with pytest.raises(sqlite3.IntegrityError):
+            with populated_db.transaction():
+                populated_db.execute_query(insert, ('AMZN',))
+                populated_db.execute_query(insert, (None,))
+                populated_db.execute_query(insert, ('TSLA',))
+        
+        rows = populated_db.fetch_all("SELECT symbol FROM portfolios ORDER BY portfolio_id")
+        assert [row['symbol'] for row in rows] == ['AAPL', 'MSFT', 'GOOGL']
\ No newline at end of file
@@ -1,26 +1,21 @@
 # tests/test_integration.py
 
 import pytest
-import sys
-from pathlib import Path
-
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.data.data_loader import DataLoader
 from src.data.technical_indicators import TechnicalIndicators
 from src.models.ensemble import EnsembleModel
 from src.trading_signals.signal_generator import SignalGenerator
 from src.portfolio.portfolio_manager import PortfolioManager
+from tests._fixtures import SAMPLE_PORTFOLIO
 
 @pytest.mark.integration
 class TestEndToEndWorkflow:
     
-    def test_complete_prediction_workflow(self):
-        data_loader = DataLoader()
+    def test_complete_prediction_workflow(self, aapl_1y):
         tech_indicators = TechnicalIndicators()
         
-        df = data_loader.load_stock_data('AAPL', period='1y', use_cache=False)
+        df = aapl_1y
         assert df is not None
         
         df_with_indicators = tech_indicators.add_all_indicators(df)
@@ -37,15 +32,11 @@ class TestEndToEndWorkflow:
         assert predictions is not None
         assert len(predictions) > 0
     
-    def test_complete_trading_signals_workflow(self):
-        data_loader = DataLoader()
-        tech_indicators = TechnicalIndicators()
+    def test_complete_trading_signals_workflow(self, aapl_with_indicators):
         signal_generator = SignalGenerator()
         
-        df = data_loader.load_stock_data('AAPL', period='6mo', use_cache=False)
-        assert df is not None
-        
-        df_with_indicators = tech_indicators.add_all_indicators(df)
+        df_with_indicators = aapl_with_indicators
+        assert df_with_indicators is not None
         
         signal_data = signal_generator.generate_signal(
             df_with_indicators,
@@ -60,24 +51,12 @@ class TestEndToEndWorkflow:
     def test_complete_portfolio_workflow(self):
         portfolio_manager = PortfolioManager()
         
-        position1 = {
-            'symbol': 'AAPL',
-            'shares': 10,
-            'purchase_price': 150.00,
-            'purchase_date': '2024-01-01'
-        }
-        
-        position2 = {
-            'symbol': 'GOOGL',
-            'shares': 5,
-            'purchase_price': 140.00,
-            'purchase_date': '2024-01-15'
-        }
+        position1, position2 = SAMPLE_PORTFOLIO
         
         portfolio_manager.add_position(position1)
         portfolio_manager.add_position(position2)
         
-        portfolio = [position1, position2]
+        portfolio = list(SAMPLE_PORTFOLIO)
         
         total_value = portfolio_manager.calculate_total_value(portfolio)
         assert total_value > 0
@@ -87,7 +66,8 @@ class TestEndToEndWorkflow:
         assert len(allocation) == 2
     
     @pytest.mark.slow
-    def test_multiple_stocks_analysis(self):
+    @pytest.mark.network
+    def test_multiple_stocks_analysis(self, live_market_data):
         data_loader = DataLoader()
         symbols = ['AAPL', 'GOOGL', 'MSFT']
         
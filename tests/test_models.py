@@ -1,24 +1,22 @@
 # tests/test_models.py
 
+import gc
+
 import pytest
 import pandas as pd
 import numpy as np
-import sys
-from pathlib import Path
-
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.models.linear_regression import LinearRegressionModel
-from src.models.random_forest import RandomForestModel
-from src.models.xgboost_model import XGBoostModel
-from src.models.ensemble import EnsembleModel
-from src.data.data_loader import DataLoader
 
-@pytest.fixture
-def sample_data():
-    data_loader = DataLoader()
-    df = data_loader.load_stock_data('AAPL', period='1y', use_cache=False)
+@pytest.fixture(scope="session")
+def sample_data(aapl_3mo):
+    if aapl_3mo is None:
+        return None
+    df = aapl_3mo.copy()
+    floats = df.select_dtypes('float64').columns
+    df[floats] = df[floats].astype(np.float32)
+    for column in df.select_dtypes('integer').columns:
+        df[column] = pd.to_numeric(df[column], downcast='integer')
     return df
 
 @pytest.fixture
@@ -27,11 +25,59 @@ def lr_model():
 
 @pytest.fixture
 def rf_model():
-    return RandomForestModel(n_estimators=10)
+    from src.models.random_forest import RandomForestModel
+    return RandomForestModel(n_estimators=5)
 
 @pytest.fixture
 def xgb_model():
-    return XGBoostModel(n_estimators=10)
+    pytest.importorskip('xgboost')
+    from src.models.xgboost_model import XGBoostModel
+    return XGBoostModel(n_estimators=5)
+
+@pytest.fixture
+def ensemble_model():
+    from src.models.ensemble import EnsembleModel
+    return EnsembleModel()
+
+def _build_and_train(model, df):
+    X_train, X_test, y_train, y_test = model.split_data(df)
+    model.build()
+    model.train(X_train, y_train)
+    return model, X_train, X_test, y_train, y_test
+
+def _release(*models):
+    for model in models:
+        model.model = None
+        model.scaler = None
+    gc.collect()
+
+@pytest.fixture(scope="class")
+def trained_lr(sample_data):
+    return _build_and_train(LinearRegressionModel(), sample_data)
+
+@pytest.fixture(scope="class")
+def trained_rf(sample_data):
+    from src.models.random_forest import RandomForestModel
+    trained = _build_and_train(RandomForestModel(n_estimators=5), sample_data)
+    yield trained
+    _release(trained[0])
+
+@pytest.fixture(scope="class")
+def trained_xgb(sample_data):
+    pytest.importorskip('xgboost')
+    from src.models.xgboost_model import XGBoostModel
+    trained = _build_and_train(XGBoostModel(n_estimators=5), sample_data)
+    yield trained
+    _release(trained[0])
+
+@pytest.fixture(scope="class")
+def trained_ensemble(sample_data):
+    from src.models.ensemble import EnsembleModel
+    ensemble = EnsembleModel()
+    X_train, X_test, y_train, y_test = ensemble.models['linear_regression'].split_data(sample_data)
+    ensemble.train(X_train, y_train)
+    yield ensemble, X_train, X_test, y_train, y_test
+    _release(*ensemble.models.values())
 
 class TestLinearRegressionModel:
     
@@ -44,20 +90,14 @@ class TestLinearRegressionModel:
         lr_model.build()
         assert lr_model.model is not None
     
-    def test_model_training(self, lr_model, sample_data):
-        X_train, X_test, y_train, y_test = lr_model.split_data(sample_data)
-        
-        lr_model.build()
-        lr_model.train(X_train, y_train)
+    def test_model_training(self, trained_lr):
+        lr_model, X_train, X_test, y_train, y_test = trained_lr
         
         assert lr_model.is_trained
         assert lr_model.model is not None
     
-    def test_model_prediction(self, lr_model, sample_data):
-        X_train, X_test, y_train, y_test = lr_model.split_data(sample_data)
-        
-        lr_model.build()
-        lr_model.train(X_train, y_train)
+    def test_model_prediction(self, trained_lr):
+        lr_model, X_train, X_test, y_train, y_test = trained_lr
         
         predictions = lr_model.predict(X_test)
         
@@ -65,8 +105,8 @@ class TestLinearRegressionModel:
         assert len(predictions) == len(X_test)
         assert isinstance(predictions, np.ndarray)
     
-    def test_model_evaluation(self, lr_model, sample_data):
-        X_train, X_test, y_train, y_test = lr_model.split_data(sample_data)
+    def test_model_evaluation(self, lr_model, aapl_1y):
+        X_train, X_test, y_train, y_test = lr_model.split_data(aapl_1y)
         
         lr_model.build()
         lr_model.train(X_train, y_train)
@@ -84,21 +124,15 @@ class TestRandomForestModel:
     def test_model_initialization(self, rf_model):
         assert rf_model is not None
         assert rf_model.name == "Random Forest"
-        assert rf_model.n_estimators == 10
+        assert rf_model.n_estimators == 5
     
-    def test_model_training(self, rf_model, sample_data):
-        X_train, X_test, y_train, y_test = rf_model.split_data(sample_data)
-        
-        rf_model.build()
-        rf_model.train(X_train, y_train)
+    def test_model_training(self, trained_rf):
+        rf_model, X_train, X_test, y_train, y_test = trained_rf
         
         assert rf_model.is_trained
     
-    def test_feature_importance(self, rf_model, sample_data):
-        X_train, X_test, y_train, y_test = rf_model.split_data(sample_data)
-        
-        rf_model.build()
-        rf_model.train(X_train, y_train)
+    def test_feature_importance(self, trained_rf):
+        rf_model, X_train, X_test, y_train, y_test = trained_rf
         
         importance = rf_model.get_feature_importance()
         
@@ -113,36 +147,28 @@ class TestXGBoostModel:
         assert xgb_model is not None
         assert xgb_model.name == "XGBoost"
     
-    def test_model_training(self, xgb_model, sample_data):
-        X_train, X_test, y_train, y_test = xgb_model.split_data(sample_data)
-        
-        xgb_model.build()
-        xgb_model.train(X_train, y_train)
+    def test_model_training(self, trained_xgb):
+        xgb_model, X_train, X_test, y_train, y_test = trained_xgb
         
         assert xgb_model.is_trained
 
 class TestEnsembleModel:
     
-    def test_ensemble_initialization(self):
-        ensemble = EnsembleModel()
+    def test_ensemble_initialization(self, ensemble_model):
+        ensemble = ensemble_model
         
         assert ensemble is not None
         assert len(ensemble.models) > 0
         assert ensemble.weights is not None
     
-    def test_ensemble_training(self, sample_data):
-        ensemble = EnsembleModel()
-        X_train, X_test, y_train, y_test = ensemble.models['linear_regression'].split_data(sample_data)
-        
-        ensemble.train(X_train, y_train)
+    def test_ensemble_training(self, trained_ensemble):
+        ensemble, X_train, X_test, y_train, y_test = trained_ensemble
         
         assert ensemble.is_trained
     
-    def test_ensemble_prediction(self, sample_data):
-        ensemble = EnsembleModel()
-        X_train, X_test, y_train, y_test = ensemble.models['linear_regression'].split_data(sample_data)
+    def test_ensemble_prediction(self, trained_ensemble):
+        ensemble, X_train, X_test, y_train, y_test = trained_ensemble
         
-        ensemble.train(X_train, y_train)
         predictions = ensemble.predict(X_test)
         
         assert predictions is not None
@@ -1,16 +1,12 @@
 # tests/test_portfolio.py
 
 import pytest
-import sys
-from pathlib import Path
 from datetime import datetime
 
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
 from src.portfolio.portfolio_manager import PortfolioManager
 from src.portfolio.performance_tracker import PerformanceTracker
 from src.portfolio.risk_calculator import RiskCalculator
+from tests._fixtures import SAMPLE_PORTFOLIO
 
 @pytest.fixture
 def portfolio_manager():
@@ -26,20 +22,7 @@ def risk_calculator():
 
 @pytest.fixture
 def sample_portfolio():
-    return [
-        {
-            'symbol': 'AAPL',
-            'shares': 10,
-            'purchase_price': 150.00,
-            'purchase_date': '2024-01-01'
-        },
-        {
-            'symbol': 'GOOGL',
-            'shares': 5,
-            'purchase_price': 140.00,
-            'purchase_date': '2024-01-15'
-        }
-    ]
+    return list(SAMPLE_PORTFOLIO)
 
 class TestPortfolioManager:
     
@@ -1,20 +1,15 @@
 # tests/test_sentiment.py
 
 import pytest
-import sys
-from pathlib import Path
-
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.sentiment.sentiment_analyzer import SentimentAnalyzer
 from src.sentiment.sentiment_aggregator import SentimentAggregator
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sentiment_analyzer():
     return SentimentAnalyzer()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sentiment_aggregator():
     return SentimentAggregator()
 
@@ -23,28 +18,18 @@ class TestSentimentAnalyzer:
     def test_analyzer_initialization(self, sentiment_analyzer):
         assert sentiment_analyzer is not None
     
-    def test_analyze_positive_text(self, sentiment_analyzer):
-        text = "Apple stock is performing exceptionally well with record profits"
-        score = sentiment_analyzer.analyze_text(text)
-        
-        assert score is not None
-        assert isinstance(score, (int, float))
-        assert score > 0
-    
-    def test_analyze_negative_text(self, sentiment_analyzer):
-        text = "Company faces massive losses and declining market share"
-        score = sentiment_analyzer.analyze_text(text)
-        
-        assert score is not None
-        assert isinstance(score, (int, float))
-        assert score < 0
-    
-    def test_analyze_neutral_text(self, sentiment_analyzer):
-        text = "The company released quarterly earnings report today"
+    @pytest.mark.parametrize("text,expected_sign", [
+        ("Apple stock is performing exceptionally well with record profits", 1),
+        ("Company faces massive losses and declining market share", -1),
+        ("The company released quarterly earnings report today", None)
+    ])
+    def test_analyze_text(self, sentiment_analyzer, text, expected_sign):
         score = sentiment_analyzer.analyze_text(text)
         
         assert score is not None
         assert isinstance(score, (int, float))
+        if expected_sign is not None:
+            assert score * expected_sign > 0
     
     def test_analyze_empty_text(self, sentiment_analyzer):
         score = sentiment_analyzer.analyze_text("")
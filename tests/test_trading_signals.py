@@ -1,29 +1,50 @@
 # tests/test_trading_signals.py
 
 import pytest
+import numpy as np
 import pandas as pd
-import sys
-from pathlib import Path
-
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.trading_signals.signal_generator import SignalGenerator
 from src.trading_signals.risk_analyzer import RiskAnalyzer
-from src.data.data_loader import DataLoader
-from src.data.technical_indicators import TechnicalIndicators
+from src.trading_signals.stop_loss_calculator import StopLossCalculator
+from src.trading_signals.strategy_engine import StrategyEngine
+from src.trading_signals.hotpath import extract_bar_context, evaluate_bar
+
+@pytest.fixture(scope="session")
+def sample_data_with_indicators(aapl_with_indicators):
+    return aapl_with_indicators
 
 @pytest.fixture
-def sample_data_with_indicators():
-    data_loader = DataLoader()
-    tech_indicators = TechnicalIndicators()
+def synthetic_data_with_indicators():
+    rng = np.random.default_rng(42)
+    n = 120
+    close = 100 + np.cumsum(rng.normal(0, 2, n))
     
-    df = data_loader.load_stock_data('AAPL', period='6mo', use_cache=False)
-    df_with_indicators = tech_indicators.add_all_indicators(df)
+    df = pd.DataFrame({
+        'Open': close,
+        'High': close + rng.random(n),
+        'Low': close - rng.random(n),
+        'Close': close,
+        'Volume': rng.integers(100000, 1000000, n).astype(float)
+    }, index=pd.bdate_range('2024-01-01', periods=n))
     
-    return df_with_indicators
+    delta = df['Close'].diff()
+    gain = delta.clip(lower=0).rolling(14).mean()
+    loss = (-delta.clip(upper=0)).rolling(14).mean()
+    df['RSI'] = 100 - 100 / (1 + gain / loss)
+    df['MACD'] = df['Close'].ewm(span=12).mean() - df['Close'].ewm(span=26).mean()
+    df['MACD_Signal'] = df['MACD'].ewm(span=9).mean()
+    df['SMA_20'] = df['Close'].rolling(20).mean()
+    df['SMA_50'] = df['Close'].rolling(50).mean()
+    df['BB_Middle'] = df['SMA_20']
+    df['BB_Upper'] = df['BB_Middle'] + 2 * df['Close'].rolling(20).std()
+    df['BB_Lower'] = df['BB_Middle'] - 2 * df['Close'].rolling(20).std()
+    df['Volume_Ratio'] = df['Volume'] / df['Volume'].rolling(20).mean()
+    df['ATR'] = (df['High'] - df['Low']).rolling(14).mean()
+    
+    return df
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def signal_generator():
     return SignalGenerator()
 
@@ -31,50 +52,43 @@ def signal_generator():
 def risk_analyzer():
     return RiskAnalyzer()
 
+@pytest.fixture
+def stop_loss_calculator():
+    return StopLossCalculator()
+
+@pytest.fixture
+def strategy_engine():
+    return StrategyEngine()
+
 class TestSignalGenerator:
     
     def test_signal_generator_initialization(self, signal_generator):
         assert signal_generator is not None
     
-    def test_generate_signal_rsi_strategy(self, signal_generator, sample_data_with_indicators):
+    @pytest.mark.parametrize("strategy,sensitivity", [
+        ('RSI Strategy', 'Moderate'),
+        ('MACD Strategy', 'Moderate'),
+        ('RSI Strategy', 'Conservative'),
+        ('RSI Strategy', 'Aggressive')
+    ])
+    def test_generate_signal(self, signal_generator, sample_data_with_indicators, strategy, sensitivity):
         signal_data = signal_generator.generate_signal(
             sample_data_with_indicators,
-            strategy='RSI Strategy',
-            sensitivity='Moderate'
+            strategy=strategy,
+            sensitivity=sensitivity
         )
         
         assert signal_data is not None
-        assert 'signal' in signal_data
         assert signal_data['signal'] in ['BUY', 'SELL', 'HOLD']
-        assert 'confidence' in signal_data
         assert 0 <= signal_data['confidence'] <= 100
     
-    def test_generate_signal_macd_strategy(self, signal_generator, sample_data_with_indicators):
-        signal_data = signal_generator.generate_signal(
-            sample_data_with_indicators,
-            strategy='MACD Strategy',
-            sensitivity='Moderate'
-        )
-        
-        assert signal_data is not None
-        assert 'signal' in signal_data
-        assert signal_data['signal'] in ['BUY', 'SELL', 'HOLD']
-    
-    def test_generate_signal_different_sensitivities(self, signal_generator, sample_data_with_indicators):
-        conservative = signal_generator.generate_signal(
-            sample_data_with_indicators,
-            strategy='RSI Strategy',
-            sensitivity='Conservative'
-        )
-        
-        aggressive = signal_generator.generate_signal(
-            sample_data_with_indicators,
-            strategy='RSI Strategy',
-            sensitivity='Aggressive'
-        )
+    def test_generate_signal_accepts_bar_context(self, signal_generator, synthetic_data_with_indicators):
+        bar = extract_bar_context(synthetic_data_with_indicators)
         
-        assert conservative is not None
-        assert aggressive is not None
+        for strategy in ['AI Composite', 'RSI Strategy', 'MACD Crossover', 'Moving Average', 'Bollinger Bands', 'Momentum']:
+            from_df = signal_generator.generate_signal(synthetic_data_with_indicators, strategy=strategy)
+            from_bar = signal_generator.generate_signal(bar, strategy=strategy)
+            assert from_df == from_bar
 
 class TestRiskAnalyzer:
     
@@ -111,4 +125,108 @@ class TestRiskAnalyzer:
         
         assert position_size > 0
         assert position_size <= portfolio_size
-        
\ No newline at end of file
+
+class TestStrategyEngine:
+    
+    def test_rsi_strategy_pairs_trades(self, strategy_engine):
+        df = pd.DataFrame({
+            'Close': [10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0, 19.0, 20.0],
+            'RSI': [25, 35, 50, 75, 65, 28, 32, 20, 31, 72, 60]
+        })
+        
+        result = strategy_engine.analyze_strategy(df, 'RSI Strategy')
+        
+        assert result['total_signals'] == 5
+        assert result['win_rate'] == 100
+        assert result['avg_return'] == pytest.approx(((14 - 11) / 11 * 100 + (20 - 16) / 16 * 100) / 2)
+    
+    def test_analyze_all_strategies_matches_single(self, strategy_engine, synthetic_data_with_indicators):
+        results = strategy_engine.analyze_all_strategies(synthetic_data_with_indicators)
+        
+        for strategy in ['RSI Strategy', 'MACD Crossover', 'Moving Average', 'Bollinger Bands', 'AI Composite']:
+            single = strategy_engine.analyze_strategy(synthetic_data_with_indicators, strategy)
+            assert results[strategy] == single
+    
+    def test_composite_strategy_requires_indicator_agreement(self, strategy_engine):
+        df = pd.DataFrame({
+            'Close': [100.0, 90.0, 95.0, 110.0, 105.0],
+            'RSI': [50, 25, 40, 75, 50],
+            'MACD': [0.0, 1.0, 1.0, -1.0, -1.0],
+            'MACD_Signal': [0.0, 0.0, 0.0, 0.0, 0.0],
+            'BB_Upper': [120.0, 120.0, 120.0, 108.0, 120.0],
+            'BB_Lower': [80.0, 95.0, 80.0, 80.0, 80.0]
+        })
+        
+        result = strategy_engine.analyze_strategy(df, 'AI Composite')
+        
+        assert result['total_signals'] == 2
+        assert result['win_rate'] == 100
+        assert result['avg_return'] == pytest.approx((110 - 90) / 90 * 100)
+
+class TestStopLossCalculator:
+    
+    def test_multiple_exit_strategy(self, stop_loss_calculator):
+        exits = stop_loss_calculator.calculate_multiple_exit_strategy(100, 95, num_exits=4)
+        
+        assert len(exits) == 4
+        assert [e['exit_number'] for e in exits] == [1, 2, 3, 4]
+        assert [e['target_price'] for e in exits] == [107.5, 115.0, 122.5, 130.0]
+        assert sum(e['position_percentage'] for e in exits) == pytest.approx(100)
+    
+    def test_multiple_exit_strategy_batch_matches_single(self, stop_loss_calculator):
+        entries = [100, 250, 40]
+        stops = [95, 240, 38.5]
+        
+        batch = stop_loss_calculator.calculate_multiple_exit_strategy_batch(entries, stops, num_exits=3)
+        
+        for row, (entry, stop) in enumerate(zip(entries, stops)):
+            single = stop_loss_calculator.calculate_multiple_exit_strategy(entry, stop, num_exits=3)
+            assert list(batch['target_prices'][row]) == [e['target_price'] for e in single]
+    
+    def test_multiple_exit_strategy_without_exits(self, stop_loss_calculator):
+        assert stop_loss_calculator.calculate_multiple_exit_strategy(100, 95, num_exits=0) == []
+        
+        batch = stop_loss_calculator.calculate_multiple_exit_strategy_batch([100, 250], [95, 240], num_exits=0)
+        
+        assert batch['exit_numbers'].size == 0
+        assert batch['target_prices'].shape == (2, 0)
+    
+    def test_comprehensive_analysis_accepts_bar_context(self, stop_loss_calculator, synthetic_data_with_indicators):
+        entry_price = synthetic_data_with_indicators['Close'].iloc[-1]
+        bar = extract_bar_context(synthetic_data_with_indicators)
+        
+        from_df = stop_loss_calculator.get_comprehensive_stop_analysis(entry_price, synthetic_data_with_indicators)
+        from_bar = stop_loss_calculator.get_comprehensive_stop_analysis(entry_price, bar)
+        
+        assert from_df == from_bar
+    
+    def test_chandelier_stop_accepts_bar_context(self, stop_loss_calculator, synthetic_data_with_indicators):
+        entry_price = synthetic_data_with_indicators['Close'].iloc[-1]
+        bar = extract_bar_context(synthetic_data_with_indicators)
+        
+        from_df = stop_loss_calculator.calculate_chandelier_stop(synthetic_data_with_indicators, entry_price)
+        from_bar = stop_loss_calculator.calculate_chandelier_stop(bar, entry_price)
+        
+        assert from_df == from_bar
+        with pytest.raises(ValueError):
+            stop_loss_calculator.calculate_chandelier_stop(bar, entry_price, lookback=30)
+    
+    def test_parabolic_sar_stop_accepts_bar_context(self, stop_loss_calculator, synthetic_data_with_indicators):
+        entry_price = synthetic_data_with_indicators['Close'].iloc[-1]
+        bar = extract_bar_context(synthetic_data_with_indicators)
+        
+        from_df = stop_loss_calculator.calculate_parabolic_sar_stop(synthetic_data_with_indicators, entry_price)
+        from_bar = stop_loss_calculator.calculate_parabolic_sar_stop(bar, entry_price)
+        
+        assert from_df == from_bar
+    
+    def test_evaluate_bar(self, signal_generator, stop_loss_calculator, synthetic_data_with_indicators):
+        signal_data, stop_analysis = evaluate_bar(
+            synthetic_data_with_indicators,
+            signal_generator,
+            stop_loss_calculator
+        )
+        
+        assert signal_data['signal'] in ['BUY', 'SELL', 'HOLD']
+        assert stop_analysis['entry_price'] == synthetic_data_with_indicators['Close'].iloc[-1]
+        assert stop_analysis['optimal_stop'] < stop_analysis['entry_price']
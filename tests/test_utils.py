@@ -0,0 +1,32 @@
+# tests/test_utils.py
+
+import pytest
+from datetime import date, datetime
+
+from src.utils.helpers import get_business_days
+from src.utils.validators import Validators
+
+class TestHelpers:
+    
+    @pytest.mark.parametrize("start,end,expected", [
+        ('2024-01-15', '2024-01-31', 13),
+        ('01/15/2024', '01/31/2024', 13),
+        (date(2024, 1, 6), date(2024, 1, 7), 0),
+        (datetime(2024, 1, 1, 10), datetime(2024, 1, 5, 9), 4),
+        (datetime(2024, 1, 1, 10), datetime(2024, 1, 5, 10), 5),
+        ('2024-01-31', '2024-01-15', 0)
+    ])
+    def test_get_business_days(self, start, end, expected):
+        assert get_business_days(start, end) == expected
+
+class TestValidators:
+    
+    @pytest.mark.parametrize("allocations,expected", [
+        ({'A': 50, 'B': 50}, True),
+        ({'A': 60.5, 'B': 40}, True),
+        ({'A': 50, 'B': 30}, False),
+        ({'A': '50', 'B': '50'}, False),
+        ({'A': 50, 'B': None}, False)
+    ])
+    def test_validate_portfolio_allocation(self, allocations, expected):
+        assert Validators.validate_portfolio_allocation(allocations) is expected
\ No newline at end of file
@@ -0,0 +1,44 @@
+# tests/test_visualization.py
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.visualization.plotly_charts import PlotlyCharts
+
+@pytest.fixture
+def price_data():
+    rng = np.random.default_rng(7)
+    n = 60
+    close = 100 + np.cumsum(rng.normal(0, 2, n))
+    
+    df = pd.DataFrame({
+        'Open': close,
+        'High': close + rng.random(n),
+        'Low': close - rng.random(n),
+        'Close': close,
+        'Volume': rng.integers(100000, 1000000, n).astype(float)
+    }, index=pd.bdate_range('2024-01-01', periods=n))
+    df['SMA_20'] = df['Close'].rolling(20).mean()
+    df['SMA_50'] = df['Close'].rolling(50).mean()
+    df['EMA_12'] = df['Close'].ewm(span=12).mean()
+    
+    return df
+
+class TestFigureCache:
+    
+    def test_cached_chart_is_not_shared_between_callers(self, price_data):
+        charts = PlotlyCharts()
+        
+        first = charts.plot_moving_averages(price_data, symbol="TEST")
+        expected = first.to_json()
+        
+        first.update_layout(title="Mutated")
+        first.add_hline(y=0)
+        
+        second = charts.plot_moving_averages(price_data, symbol="TEST")
+        third = charts.plot_moving_averages(price_data, symbol="TEST")
+        
+        assert second is not third
+        assert second.to_json() == expected
+        assert third.to_json() == expected
\ No newline at end of file